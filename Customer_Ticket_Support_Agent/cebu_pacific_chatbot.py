@@ -43,11 +43,18 @@ $ streamlit run cebu_pacific_chatbot.py
 
 import streamlit as st
 import dspy
+import asyncio
+import io
 import json
 import os
+import re
+import threading
 import time
+from collections import deque
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
 # Optional imports with graceful fallback
@@ -61,7 +68,19 @@ except ImportError:
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
+
+    # Shared keep-alive session for all MLflow REST calls: connection pooling
+    # amortizes the TCP+TLS handshake instead of paying it per request
+    _MLFLOW_SESSION = requests.Session()
+    _mlflow_adapter = HTTPAdapter(
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.2)
+    )
+    _MLFLOW_SESSION.mount("http://", _mlflow_adapter)
+    _MLFLOW_SESSION.mount("https://", _mlflow_adapter)
 except ImportError:
     REQUESTS_AVAILABLE = False
     st.warning("Requests not installed. MLflow features limited.")
@@ -73,6 +92,21 @@ try:
 except ImportError:
     DOTENV_AVAILABLE = False
 
+# orjson parses JSON several times faster than the stdlib; fall back silently
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# numba JIT-compiles the numeric projections when available; the NumPy
+# fallback keeps the app fully functional without it
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -107,6 +141,10 @@ class Config:
     EXPERIMENT_NAME = "cebu_pacific_optimization"
 
 
+# Evaluated once at import so the hot path never re-reads the environment
+_HAS_KEY = bool(Config.GROQ_API_KEY)
+
+
 # Example queries organized by category
 EXAMPLE_QUERIES = {
     "🔍 Web Check-in Issues": [
@@ -135,6 +173,16 @@ EXAMPLE_QUERIES = {
     ]
 }
 
+# Button labels and widget keys precomputed once at import so the chat tab
+# doesn't re-run f-string formatting for every button on every rerun
+_EXAMPLE_BUTTONS = tuple(
+    (category, tuple(
+        (f"📝 {query[:50]}...", f"example_{cat_idx}_{q_idx}", query)
+        for q_idx, query in enumerate(queries)
+    ))
+    for cat_idx, (category, queries) in enumerate(EXAMPLE_QUERIES.items())
+)
+
 
 # ============================================================================
 # SUPPORT AGENT CLASS
@@ -171,88 +219,243 @@ class SupportAgent(dspy.Module):
 # HELPER FUNCTIONS
 # ============================================================================
 
+def render_missing_key_banner():
+    """Shared guidance shown wherever the agent is unusable without a key."""
+    st.error("⚠️ GROQ_API_KEY not configured! Please set it in environment or .env file.")
+    st.code("export GROQ_API_KEY='your_key_here'")
+
+
+@st.cache_data
+def _read_agent_json(path: str, mtime: float) -> bytes:
+    """
+    Read the optimized agent file from disk.
+
+    The mtime argument is part of the cache key, so the cache invalidates
+    automatically when the file is re-exported by the optimization script.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
 @st.cache_resource
+def _build_lm() -> dspy.LM:
+    """
+    Construct the Groq LM and register it with DSPy exactly once.
+
+    Returns:
+        Configured dspy.LM instance
+    """
+    if not _HAS_KEY:
+        raise RuntimeError("GROQ_API_KEY not configured")
+
+    # All decoding parameters are frozen at construction so the adapter
+    # doesn't re-negotiate defaults on every call; cache=True reuses
+    # DSPy's on-disk completion cache for repeated queries
+    lm = dspy.LM(
+        'groq/llama-3.1-8b-instant',
+        api_key=Config.GROQ_API_KEY,
+        max_tokens=Config.DEFAULT_MAX_TOKENS,
+        temperature=Config.DEFAULT_TEMPERATURE,
+        top_p=1.0,
+        stop=["\n\nUser:"],
+        cache=True,
+        num_retries=1
+    )
+    dspy.configure(lm=lm)
+    return lm
+
+
+@st.cache_resource
+def _materialize_agent(agent_json: Optional[bytes]) -> SupportAgent:
+    """
+    Instantiate a SupportAgent and load optimized state from memory.
+
+    Args:
+        agent_json: Raw agent JSON bytes, or None for an unoptimized agent
+
+    Returns:
+        SupportAgent instance
+    """
+    agent = SupportAgent()
+    if agent_json is not None:
+        agent.load_state(_json_loads(agent_json))
+    return agent
+
+
 def load_optimized_agent() -> Optional[SupportAgent]:
     """
-    Load the optimized agent from JSON file with caching.
+    Load the optimized agent, coordinating the cached layers above.
+
+    Splitting the disk read (cache_data, mtime-keyed), the LM handle
+    (cache_resource) and the agent materialization (cache_resource) lets
+    each be invalidated independently instead of rebuilding everything.
 
     Returns:
         SupportAgent instance or None if loading fails
     """
     try:
         # Check API key
-        if not Config.GROQ_API_KEY:
-            st.error("⚠️ GROQ_API_KEY not configured! Please set it in environment or .env file.")
-            st.code("export GROQ_API_KEY='your_key_here'")
+        if not _HAS_KEY:
+            render_missing_key_banner()
             return None
 
-        # Configure DSPy with Groq
-        lm = dspy.LM(
-            'groq/llama-3.1-8b-instant',
-            api_key=Config.GROQ_API_KEY,
-            max_tokens=Config.DEFAULT_MAX_TOKENS,
-            temperature=Config.DEFAULT_TEMPERATURE
-        )
-        dspy.configure(lm=lm)
-
-        # Create agent
-        agent = SupportAgent()
+        # Configure DSPy with Groq (no-op after first call)
+        _build_lm()
 
         # Load optimized parameters
         if os.path.exists(Config.AGENT_FILE):
-            agent.load(Config.AGENT_FILE)
-            st.success(f"✅ Optimized agent loaded from {Config.AGENT_FILE}")
-            return agent
+            agent_json = _read_agent_json(Config.AGENT_FILE, os.path.getmtime(Config.AGENT_FILE))
+            return _materialize_agent(agent_json)
         else:
             st.warning(f"⚠️ {Config.AGENT_FILE} not found! Using unoptimized agent (26% quality).")
             st.info("Place the optimized agent file in the same directory as this script.")
-            return agent
+            return _materialize_agent(None)
 
     except Exception as e:
         st.error(f"❌ Error loading agent: {str(e)}")
         return None
 
 
+def get_agent() -> Optional[SupportAgent]:
+    """
+    Return the session's agent as a plain session_state read.
+
+    load_optimized_agent is called from several places per rerun; even a
+    cache_resource hit pays key hashing and lock acquisition, so the
+    handle is stashed on session state after the first lookup.
+    """
+    if not _HAS_KEY:
+        return None
+
+    agent = st.session_state.get("agent")
+    if agent is None:
+        agent = load_optimized_agent()
+        st.session_state.agent = agent
+    return agent
+
+
+@dataclass(frozen=True, slots=True)
+class OptResults:
+    """Immutable snapshot of optimization results.
+
+    Field defaults mirror the published optimization run so the analytics
+    tab works even when optimization_results.json is missing. Frozen +
+    slots keeps instances hashable (usable as st.cache_data keys) and
+    makes attribute access cheaper than nested dict lookups.
+    """
+    baseline_quality: float = 0.26
+    baseline_min_score: float = 0.0
+    baseline_max_score: float = 0.8
+    baseline_response_time: float = 5.0
+    baseline_std_dev: float = 0.24
+    optimized_quality: float = 0.72
+    optimized_min_score: float = 0.4
+    optimized_max_score: float = 1.0
+    optimized_response_time: float = 0.5
+    optimized_std_dev: float = 0.16
+    quality_gain: float = 0.46
+    quality_gain_pct: float = 176.9
+    annual_cost_savings_usd: float = 821250.0
+    daily_cost_savings_usd: float = 2250.0
+
+
 @st.cache_data
-def load_optimization_results() -> Dict[str, Any]:
+def _read_results_json(path: str, mtime: float) -> Dict[str, Any]:
     """
-    Load optimization results from JSON file.
+    Parse the results file with orjson when available.
+
+    The mtime argument keys the cache, so an updated file re-parses once
+    and every other rerun is a cache hit.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def load_optimization_results() -> Optional[OptResults]:
+    """
+    Load optimization results from JSON file into an immutable dataclass.
 
     Returns:
-        Dict containing optimization results or default values
+        OptResults instance (defaults if file not found) or None on error
     """
     try:
-        if os.path.exists(Config.RESULTS_FILE):
-            with open(Config.RESULTS_FILE, 'r') as f:
-                return json.load(f)
-        else:
-            # Return default values if file not found
-            return {
-                "baseline_performance": {
-                    "avg_quality_score": 0.26,
-                    "avg_response_time_seconds": 5.0
-                },
-                "optimized_performance": {
-                    "avg_quality_score": 0.72,
-                    "avg_response_time_seconds": 0.5
-                },
-                "improvements": {
-                    "quality_score_gain": 0.46,
-                    "quality_score_gain_pct": 176.9
-                },
-                "business_impact": {
-                    "annual_cost_savings_usd": 821250,
-                    "daily_cost_savings_usd": 2250
-                }
-            }
+        if not os.path.exists(Config.RESULTS_FILE):
+            return OptResults()
+
+        raw = _read_results_json(Config.RESULTS_FILE, os.path.getmtime(Config.RESULTS_FILE))
+
+        defaults = OptResults()
+        baseline = raw.get("baseline_performance", {})
+        optimized = raw.get("optimized_performance", {})
+        improvements = raw.get("improvements", {})
+        business = raw.get("business_impact", {})
+
+        return OptResults(
+            baseline_quality=baseline.get("avg_quality_score", defaults.baseline_quality),
+            baseline_min_score=baseline.get("min_score", defaults.baseline_min_score),
+            baseline_max_score=baseline.get("max_score", defaults.baseline_max_score),
+            baseline_response_time=baseline.get("avg_response_time_seconds", defaults.baseline_response_time),
+            baseline_std_dev=baseline.get("std_dev", defaults.baseline_std_dev),
+            optimized_quality=optimized.get("avg_quality_score", defaults.optimized_quality),
+            optimized_min_score=optimized.get("min_score", defaults.optimized_min_score),
+            optimized_max_score=optimized.get("max_score", defaults.optimized_max_score),
+            optimized_response_time=optimized.get("avg_response_time_seconds", defaults.optimized_response_time),
+            optimized_std_dev=optimized.get("std_dev", defaults.optimized_std_dev),
+            quality_gain=improvements.get("quality_score_gain", defaults.quality_gain),
+            quality_gain_pct=improvements.get("quality_score_gain_pct", defaults.quality_gain_pct),
+            annual_cost_savings_usd=business.get("annual_cost_savings_usd", defaults.annual_cost_savings_usd),
+            daily_cost_savings_usd=business.get("daily_cost_savings_usd", defaults.daily_cost_savings_usd),
+        )
     except Exception as e:
         st.error(f"Error loading results: {str(e)}")
-        return {}
+        return None
 
 
+@st.cache_data
+def build_comparison_rows(results: OptResults) -> tuple:
+    """
+    Build the before/after comparison rows once per results snapshot.
+
+    A constant 5x4 table doesn't need DataFrame machinery or Arrow
+    serialization; plain dict rows feed st.table directly.
+
+    Args:
+        results: Loaded optimization results
+
+    Returns:
+        Tuple of pre-formatted row dicts
+    """
+    def row(metric, before, after, change):
+        return {"Metric": metric, "Before": before, "After": after, "Change": change}
+
+    return (
+        row("Quality Score",
+            f"{results.baseline_quality*100:.0f}%",
+            f"{results.optimized_quality*100:.0f}%",
+            f"+{results.quality_gain*100:.0f}%"),
+        row("Min Score",
+            f"{results.baseline_min_score*100:.0f}%",
+            f"{results.optimized_min_score*100:.0f}%",
+            f"+{(results.optimized_min_score - results.baseline_min_score)*100:.0f}%"),
+        row("Max Score",
+            f"{results.baseline_max_score*100:.0f}%",
+            f"{results.optimized_max_score*100:.0f}%",
+            f"+{(results.optimized_max_score - results.baseline_max_score)*100:.0f}%"),
+        row("Response Time",
+            f"{results.baseline_response_time:.1f}s",
+            f"{results.optimized_response_time:.1f}s",
+            f"-{(results.baseline_response_time - results.optimized_response_time):.1f}s"),
+        row("Consistency",
+            f"{results.baseline_std_dev*100:.0f}%",
+            f"{results.optimized_std_dev*100:.0f}%",
+            f"-{(results.baseline_std_dev - results.optimized_std_dev)*100:.0f}%"),
+    )
+
+
+@st.cache_data(ttl=60)
 def check_mlflow_connection() -> bool:
     """
-    Check if MLflow server is accessible.
+    Check if MLflow server is accessible (cached for 60s across reruns).
 
     Returns:
         True if MLflow is accessible, False otherwise
@@ -261,15 +464,16 @@ def check_mlflow_connection() -> bool:
         return False
 
     try:
-        response = requests.get(f"{Config.MLFLOW_URI}/health", timeout=2)
+        response = _MLFLOW_SESSION.get(f"{Config.MLFLOW_URI}/health", timeout=(1, 3))
         return response.status_code == 200
     except:
         return False
 
 
+@st.cache_data(ttl=30)
 def get_mlflow_experiments() -> List[Dict]:
     """
-    Fetch experiments from MLflow.
+    Fetch experiments from MLflow (cached for 30s across reruns).
 
     Returns:
         List of experiment dictionaries
@@ -278,7 +482,10 @@ def get_mlflow_experiments() -> List[Dict]:
         return []
 
     try:
-        response = requests.get(f"{Config.MLFLOW_URI}/api/2.0/mlflow/experiments/search")
+        response = _MLFLOW_SESSION.get(
+            f"{Config.MLFLOW_URI}/api/2.0/mlflow/experiments/search",
+            timeout=(1, 3)
+        )
         if response.status_code == 200:
             return response.json().get('experiments', [])
     except Exception as e:
@@ -286,49 +493,198 @@ def get_mlflow_experiments() -> List[Dict]:
     return []
 
 
-def get_mlflow_runs(experiment_id: str) -> List[Dict]:
+@st.cache_data(ttl=30)
+def get_runs_for_experiments(experiment_ids: tuple, max_results: int = 500) -> Dict[str, List[Dict]]:
     """
-    Fetch runs from MLflow experiment.
+    Fetch runs for several experiments in one REST call.
+
+    MLflow's runs/search accepts multiple experiment_ids, so the 1 + N
+    round trips of a per-experiment walk collapse into a single POST;
+    results are grouped client-side and payloads decode via orjson when
+    available.
 
     Args:
-        experiment_id: MLflow experiment ID
+        experiment_ids: Tuple of MLflow experiment IDs
+        max_results: Server-side cap on returned runs
 
     Returns:
-        List of run dictionaries
+        Dict mapping experiment ID to its list of runs, newest first
     """
-    if not REQUESTS_AVAILABLE:
-        return []
+    if not REQUESTS_AVAILABLE or not experiment_ids:
+        return {}
 
     try:
-        response = requests.post(
+        response = _MLFLOW_SESSION.post(
             f"{Config.MLFLOW_URI}/api/2.0/mlflow/runs/search",
-            json={"experiment_ids": [experiment_id]}
+            json={
+                "experiment_ids": list(experiment_ids),
+                "max_results": max_results,
+                "order_by": ["attributes.start_time DESC"]
+            },
+            timeout=(1, 3)
         )
         if response.status_code == 200:
-            return response.json().get('runs', [])
+            grouped = {exp_id: [] for exp_id in experiment_ids}
+            for run in _json_loads(response.content).get('runs', []):
+                exp_id = run.get('info', {}).get('experiment_id')
+                grouped.setdefault(exp_id, []).append(run)
+            return grouped
     except Exception as e:
         st.error(f"Error fetching runs: {str(e)}")
-    return []
+    return {}
+
+
+# Precompiled quality scan: one case-insensitive regex pass replaces five
+# independent substring scans (and their repeated .lower() copies) per response
+_QUALITY_RE = re.compile(r"step|option|yes|php|fee|phone|www|[@$:•]", re.IGNORECASE)
+
+# Maps each matched marker to its quality-indicator slot
+# (slot 1 is the length check, handled separately)
+_QUALITY_SLOTS = {
+    "step": 0, "option": 0,
+    ":": 2, "•": 2, "yes": 2,
+    "@": 3, "www": 3, "phone": 3,
+    "$": 4, "php": 4, "fee": 4,
+}
+
+
+def _score_and_meta(text: str) -> tuple:
+    """
+    Compute quality score and character count in a single pass.
+
+    Args:
+        text: Agent response text
+
+    Returns:
+        Tuple of (quality score between 0 and 1, response length)
+    """
+    quality_indicators = [False] * 5
+    length = len(text)
+    quality_indicators[1] = length > 200
+
+    for match in _QUALITY_RE.finditer(text):
+        quality_indicators[_QUALITY_SLOTS[match.group().lower()]] = True
+
+    return sum(quality_indicators) / len(quality_indicators), length
 
 
 def calculate_quality_score(response: str) -> float:
     """
     Estimate quality score for a response based on heuristics.
 
+    Scans the response once with a precompiled regex instead of five
+    separate substring checks.
+
     Args:
         response: Agent response text
 
     Returns:
         Quality score between 0 and 1
     """
-    quality_indicators = [
-        "step" in response.lower() or "option" in response.lower(),
-        len(response) > 200,
-        ":" in response or "•" in response or "yes" in response.lower(),
-        "@" in response or "www" in response or "phone" in response.lower(),
-        "$" in response or "php" in response.lower() or "fee" in response.lower()
-    ]
-    return sum(quality_indicators) / len(quality_indicators)
+    return _score_and_meta(response)[0]
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True, fastmath=True)
+    def projected_savings(daily: float, n_months: int) -> np.ndarray:
+        out = np.empty(n_months)
+        for i in range(n_months):
+            out[i] = daily * 30.0 * (i + 1)
+        return out
+else:
+    def projected_savings(daily: float, n_months: int) -> np.ndarray:
+        return daily * 30.0 * np.arange(1, n_months + 1, dtype=np.float64)
+
+
+if PLOTLY_AVAILABLE:
+    # Figure builders take only primitive args (floats, tuples) so the
+    # st.cache_data keys are cheap and figures rebuild only on input change
+
+    @st.cache_data(ttl=3600)
+    def _quality_bar_fig(baseline_quality: float, optimized_quality: float):
+        """Cached quality before/after bar chart."""
+        fig = go.Figure(data=[
+            go.Bar(
+                name='Before',
+                x=['Quality Score'],
+                y=[baseline_quality * 100],
+                marker_color='#FF6B6B'
+            ),
+            go.Bar(
+                name='After',
+                x=['Quality Score'],
+                y=[optimized_quality * 100],
+                marker_color='#4ECDC4'
+            )
+        ])
+        fig.update_layout(
+            title="Quality Score Comparison",
+            yaxis_title="Quality (%)",
+            barmode='group',
+            height=400
+        )
+        return fig
+
+    @st.cache_data(ttl=3600)
+    def _response_time_fig(baseline_time: float, optimized_time: float):
+        """Cached response-time before/after bar chart."""
+        fig = go.Figure(data=[
+            go.Bar(
+                name='Before',
+                x=['Response Time'],
+                y=[baseline_time],
+                marker_color='#FF6B6B'
+            ),
+            go.Bar(
+                name='After',
+                x=['Response Time'],
+                y=[optimized_time],
+                marker_color='#4ECDC4'
+            )
+        ])
+        fig.update_layout(
+            title="Response Time Comparison",
+            yaxis_title="Time (seconds)",
+            barmode='group',
+            height=400
+        )
+        return fig
+
+    @st.cache_data(ttl=3600)
+    def _savings_line_fig(daily_cost_savings: float):
+        """Cached cumulative-savings projection line chart."""
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=np.arange(1, 13),
+            y=projected_savings(daily_cost_savings, 12),
+            mode='lines+markers',
+            name='Cumulative Savings',
+            line=dict(color='#4ECDC4', width=3),
+            marker=dict(size=8)
+        ))
+        fig.update_layout(
+            title="Projected Annual Savings",
+            xaxis_title="Month",
+            yaxis_title="Cumulative Savings ($)",
+            height=400
+        )
+        return fig
+
+    @st.cache_data(ttl=3600)
+    def _quality_hist_fig(quality_scores: tuple):
+        """Cached session quality-score histogram."""
+        fig = go.Figure(data=[go.Histogram(
+            x=np.asarray(quality_scores, dtype=np.float32) * 100,
+            nbinsx=10,
+            marker_color='#4ECDC4'
+        )])
+        fig.update_layout(
+            title="Quality Score Distribution (This Session)",
+            xaxis_title="Quality Score (%)",
+            yaxis_title="Count",
+            height=300
+        )
+        return fig
 
 
 def format_timestamp(timestamp: Optional[float]) -> str:
@@ -360,28 +716,60 @@ def export_chat_history(messages: List[Dict]) -> str:
     Returns:
         Formatted chat transcript
     """
-    lines = [
-        "=" * 70,
-        "CEBU PACIFIC AI SUPPORT CHATBOT - CHAT TRANSCRIPT",
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-        "=" * 70,
-        ""
-    ]
+    buf = io.StringIO()
+    w = buf.write
+
+    w("=" * 70 + "\n")
+    w("CEBU PACIFIC AI SUPPORT CHATBOT - CHAT TRANSCRIPT\n")
+    w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    w("=" * 70 + "\n\n")
 
     for i, msg in enumerate(messages, 1):
         role = "USER" if msg["role"] == "user" else "ASSISTANT"
-        lines.append(f"[{i}] {role}:")
-        lines.append(msg["content"])
-        lines.append("")
+        w(f"[{i}] {role}:\n")
+        w(msg["content"])
+        w("\n\n")
 
-    lines.append("=" * 70)
-    return "\n".join(lines)
+    w("=" * 70)
+    return buf.getvalue()
 
 
 # ============================================================================
 # SESSION STATE INITIALIZATION
 # ============================================================================
 
+def _probe_mlflow_async():
+    """
+    Probe MLflow connectivity on a daemon thread.
+
+    The synchronous probe can block for the full connect timeout, so it
+    runs off the render path and records its result in session state;
+    the UI shows a "checking" badge until then.
+    """
+    def _probe():
+        st.session_state["mlflow_connected"] = check_mlflow_connection()
+
+    thread = threading.Thread(target=_probe, daemon=True)
+    try:
+        # Threads need the script-run context to touch session_state
+        from streamlit.runtime.scriptrunner import add_script_run_ctx
+        add_script_run_ctx(thread)
+    except Exception:
+        pass
+    thread.start()
+
+
+def _next_message_id() -> int:
+    """Return a monotonically increasing id for chat messages.
+
+    Ids are stable within a session, unlike hash()-based keys which vary
+    across Python invocations under randomized string hashing.
+    """
+    next_id = st.session_state.get("next_message_id", 0)
+    st.session_state.next_message_id = next_id + 1
+    return next_id
+
+
 def initialize_session_state():
     """Initialize session state variables"""
     if "messages" not in st.session_state:
@@ -390,56 +778,107 @@ def initialize_session_state():
     if "agent_loaded" not in st.session_state:
         st.session_state.agent_loaded = False
 
-    if "session_start_time" not in st.session_state:
-        st.session_state.session_start_time = datetime.now()
+    if "session_start_monotonic" not in st.session_state:
+        st.session_state.session_start_monotonic = time.monotonic()
 
     if "total_response_time" not in st.session_state:
         st.session_state.total_response_time = 0.0
 
+    # Raw scores are kept only for the histogram, bounded by history size;
+    # averages come from O(1) running aggregates instead of rescanning
     if "quality_scores" not in st.session_state:
-        st.session_state.quality_scores = []
+        st.session_state.quality_scores = deque(maxlen=Config.MAX_CHAT_HISTORY)
+
+    # Running (count, sum, sum of squares) over all quality scores
+    if "quality_agg" not in st.session_state:
+        st.session_state.quality_agg = [0, 0.0, 0.0]
 
     if "mlflow_connected" not in st.session_state:
-        st.session_state.mlflow_connected = check_mlflow_connection()
+        st.session_state.mlflow_connected = None
+        _probe_mlflow_async()
 
 
 # ============================================================================
 # TAB 1: CHAT INTERFACE
 # ============================================================================
 
+async def _stream_response(agent, query: str, slot) -> tuple:
+    """
+    Stream the agent's answer token-by-token into a placeholder slot.
+
+    Args:
+        agent: SupportAgent instance
+        query: Customer support question
+        slot: st.empty() placeholder to render partial output into
+
+    Returns:
+        Tuple of (final dspy.Prediction, time-to-first-token in seconds)
+    """
+    stream_agent = dspy.streamify(
+        agent,
+        stream_listeners=[dspy.streaming.StreamListener(signature_field_name="answer")]
+    )
+
+    started = time.time()
+    first_token_time = None
+    buf = []
+    prediction = None
+
+    async for chunk in stream_agent(query=query):
+        if isinstance(chunk, dspy.streaming.StreamResponse):
+            if first_token_time is None:
+                first_token_time = time.time() - started
+            buf.append(chunk.chunk)
+            slot.markdown("".join(buf))
+        elif isinstance(chunk, dspy.Prediction):
+            prediction = chunk
+
+    return prediction, first_token_time
+
+
 def generate_response_for_query(query):
     """Generate and display response for a user query"""
-    agent = load_optimized_agent()
+    agent = get_agent()
     if agent:
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 start_time = time.time()
 
                 try:
-                    response = agent(query=query)
+                    slot = st.empty()
+                    response, ttft = asyncio.run(_stream_response(agent, query, slot))
                     answer = response.answer
                     response_time = time.time() - start_time
 
                     # Update stats
                     st.session_state.total_response_time += response_time
-                    quality = calculate_quality_score(answer)
+                    quality, answer_len = _score_and_meta(answer)
                     st.session_state.quality_scores.append(quality)
+                    agg = st.session_state.quality_agg
+                    agg[0] += 1
+                    agg[1] += quality
+                    agg[2] += quality * quality
 
-                    # Display response
-                    st.markdown(answer)
+                    # Final render (replaces the streamed partial output)
+                    slot.markdown(answer)
 
                     # Show metrics
                     col_a, col_b, col_c = st.columns(3)
-                    col_a.caption(f"⏱️ {response_time:.2f}s")
+                    if ttft is not None:
+                        col_a.caption(f"⏱️ {response_time:.2f}s (first token {ttft:.2f}s)")
+                    else:
+                        col_a.caption(f"⏱️ {response_time:.2f}s")
                     col_b.caption(f"📊 Quality: {quality*100:.0f}%")
-                    col_c.caption(f"📏 {len(answer)} chars")
+                    col_c.caption(f"📏 {answer_len} chars")
 
                     # Add to history
                     st.session_state.messages.append({
+                        "id": _next_message_id(),
                         "role": "assistant",
                         "content": answer,
                         "metadata": {
                             "response_time": response_time,
+                            "time_to_first_token": ttft,
                             "quality": quality
                         }
                     })
@@ -448,7 +887,10 @@ def generate_response_for_query(query):
                     st.error(f"❌ Error generating response: {str(e)}")
                     st.info("Please try again or rephrase your question.")
     else:
-        st.error("Agent not loaded. Please check configuration.")
+        if not _HAS_KEY:
+            render_missing_key_banner()
+        else:
+            st.error("Agent not loaded. Please check configuration.")
 
 
 def render_chat_tab():
@@ -461,13 +903,15 @@ def render_chat_tab():
     with st.sidebar:
         st.subheader("🤖 Agent Status")
 
-        agent = load_optimized_agent()
+        agent = get_agent()
         if agent:
             st.success("✅ Agent Loaded (72% Quality)")
             st.info("🚀 Model: llama-3.1-8b-instant")
             st.info(f"🔌 API: {'Connected' if Config.GROQ_API_KEY else 'Not configured'}")
         else:
             st.error("❌ Agent Not Loaded")
+            if not _HAS_KEY:
+                render_missing_key_banner()
 
         st.markdown("---")
 
@@ -480,12 +924,12 @@ def render_chat_tab():
             avg_time = st.session_state.total_response_time / (msg_count / 2)
             st.metric("Avg Response Time", f"{avg_time:.2f}s")
 
-            if st.session_state.quality_scores:
-                avg_quality = sum(st.session_state.quality_scores) / len(st.session_state.quality_scores)
-                st.metric("Avg Quality", f"{avg_quality*100:.0f}%")
+            agg = st.session_state.quality_agg
+            if agg[0] > 0:
+                st.metric("Avg Quality", f"{agg[1] / agg[0] * 100:.0f}%")
 
-        duration = datetime.now() - st.session_state.session_start_time
-        st.metric("Session Duration", f"{duration.seconds // 60}m {duration.seconds % 60}s")
+        elapsed = int(time.monotonic() - st.session_state.session_start_monotonic)
+        st.metric("Session Duration", f"{elapsed // 60}m {elapsed % 60}s")
 
         st.markdown("---")
 
@@ -512,12 +956,16 @@ def render_chat_tab():
     with col2:
         st.subheader("🚀 Try These Examples")
 
-        for category, queries in EXAMPLE_QUERIES.items():
+        for category, buttons in _EXAMPLE_BUTTONS:
             with st.expander(category):
-                for query in queries:
-                    if st.button(f"📝 {query[:50]}...", key=f"example_{hash(query)}", use_container_width=True):
+                for label, key, query in buttons:
+                    if st.button(label, key=key, use_container_width=True):
                         # Add to messages and trigger response
-                        st.session_state.messages.append({"role": "user", "content": query})
+                        st.session_state.messages.append({
+                            "id": _next_message_id(),
+                            "role": "user",
+                            "content": query
+                        })
                         st.rerun()
 
     with col1:
@@ -533,7 +981,11 @@ def render_chat_tab():
         # Chat input
         if prompt := st.chat_input("How can I help you today?"):
             # Add user message
-            st.session_state.messages.append({"role": "user", "content": prompt})
+            st.session_state.messages.append({
+                "id": _next_message_id(),
+                "role": "user",
+                "content": prompt
+            })
 
             # Generate response
             generate_response_for_query(prompt)
@@ -547,11 +999,18 @@ def render_chat_tab():
                 if st.button("🗑️ Clear Chat History", use_container_width=True):
                     st.session_state.messages = []
                     st.session_state.total_response_time = 0.0
-                    st.session_state.quality_scores = []
+                    st.session_state.quality_scores.clear()
+                    st.session_state.quality_agg = [0, 0.0, 0.0]
                     st.rerun()
 
             with col_b:
-                transcript = export_chat_history(st.session_state.messages)
+                # Rebuild the transcript only when history has grown
+                cached = st.session_state.get("transcript_cache")
+                msg_count = len(st.session_state.messages)
+                if cached is None or cached[0] != msg_count:
+                    cached = (msg_count, export_chat_history(st.session_state.messages))
+                    st.session_state.transcript_cache = cached
+                transcript = cached[1]
                 st.download_button(
                     label="📥 Download Transcript",
                     data=transcript,
@@ -574,52 +1033,41 @@ def render_analytics_tab():
     # Load results
     results = load_optimization_results()
 
-    if not results:
+    if results is None:
         st.error("No optimization results available.")
         return
 
-    # Extract metrics
-    baseline = results.get("baseline_performance", {})
-    optimized = results.get("optimized_performance", {})
-    improvements = results.get("improvements", {})
-    business = results.get("business_impact", {})
-
     # Key metrics overview
     st.subheader("🎯 Key Performance Metrics")
 
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        baseline_quality = baseline.get("avg_quality_score", 0.26)
         st.metric(
             "Baseline Quality",
-            f"{baseline_quality*100:.0f}%",
+            f"{results.baseline_quality*100:.0f}%",
             help="Quality score before optimization"
         )
 
     with col2:
-        optimized_quality = optimized.get("avg_quality_score", 0.72)
-        improvement = improvements.get("quality_score_gain", 0.46)
         st.metric(
             "Optimized Quality",
-            f"{optimized_quality*100:.0f}%",
-            delta=f"+{improvement*100:.0f}%",
+            f"{results.optimized_quality*100:.0f}%",
+            delta=f"+{results.quality_gain*100:.0f}%",
             help="Quality score after MIPROv2 optimization"
         )
 
     with col3:
-        improvement_pct = improvements.get("quality_score_gain_pct", 176.9)
         st.metric(
             "Improvement",
-            f"+{improvement_pct:.1f}%",
+            f"+{results.quality_gain_pct:.1f}%",
             help="Relative improvement in quality"
         )
 
     with col4:
-        response_time = optimized.get("avg_response_time_seconds", 0.5)
         st.metric(
             "Response Time",
-            f"{response_time:.1f}s",
+            f"{results.optimized_response_time:.1f}s",
             help="Average time to generate response"
         )
 
@@ -628,39 +1076,7 @@ def render_analytics_tab():
     # Before/After Comparison
     st.subheader("📈 Before vs After Optimization")
 
-    comparison_data = {
-        "Metric": [
-            "Quality Score",
-            "Min Score",
-            "Max Score",
-            "Response Time",
-            "Consistency"
-        ],
-        "Before": [
-            f"{baseline_quality*100:.0f}%",
-            f"{baseline.get('min_score', 0)*100:.0f}%",
-            f"{baseline.get('max_score', 0.8)*100:.0f}%",
-            f"{baseline.get('avg_response_time_seconds', 5.0):.1f}s",
-            f"{baseline.get('std_dev', 0.24)*100:.0f}%"
-        ],
-        "After": [
-            f"{optimized_quality*100:.0f}%",
-            f"{optimized.get('min_score', 0.4)*100:.0f}%",
-            f"{optimized.get('max_score', 1.0)*100:.0f}%",
-            f"{response_time:.1f}s",
-            f"{optimized.get('std_dev', 0.16)*100:.0f}%"
-        ],
-        "Change": [
-            f"+{improvement*100:.0f}%",
-            f"+{(optimized.get('min_score', 0.4) - baseline.get('min_score', 0))*100:.0f}%",
-            f"+{(optimized.get('max_score', 1.0) - baseline.get('max_score', 0.8))*100:.0f}%",
-            f"-{(baseline.get('avg_response_time_seconds', 5.0) - response_time):.1f}s",
-            f"-{(baseline.get('std_dev', 0.24) - optimized.get('std_dev', 0.16))*100:.0f}%"
-        ]
-    }
-
-    df = pd.DataFrame(comparison_data)
-    st.dataframe(df, use_container_width=True, hide_index=True)
+    st.table(build_comparison_rows(results))
 
     st.markdown("---")
 
@@ -672,64 +1088,25 @@ def render_analytics_tab():
     with col1:
         # Quality score comparison
         if PLOTLY_AVAILABLE:
-            fig = go.Figure(data=[
-                go.Bar(
-                    name='Before',
-                    x=['Quality Score'],
-                    y=[baseline_quality * 100],
-                    marker_color='#FF6B6B'
-                ),
-                go.Bar(
-                    name='After',
-                    x=['Quality Score'],
-                    y=[optimized_quality * 100],
-                    marker_color='#4ECDC4'
-                )
-            ])
-            fig.update_layout(
-                title="Quality Score Comparison",
-                yaxis_title="Quality (%)",
-                barmode='group',
-                height=400
-            )
+            fig = _quality_bar_fig(results.baseline_quality, results.optimized_quality)
             st.plotly_chart(fig, use_container_width=True)
         else:
             # Fallback to Streamlit native
             chart_data = pd.DataFrame({
-                'Before': [baseline_quality * 100],
-                'After': [optimized_quality * 100]
+                'Before': [results.baseline_quality * 100],
+                'After': [results.optimized_quality * 100]
             })
             st.bar_chart(chart_data)
 
     with col2:
         # Response time comparison
-        baseline_time = baseline.get("avg_response_time_seconds", 5.0)
         if PLOTLY_AVAILABLE:
-            fig = go.Figure(data=[
-                go.Bar(
-                    name='Before',
-                    x=['Response Time'],
-                    y=[baseline_time],
-                    marker_color='#FF6B6B'
-                ),
-                go.Bar(
-                    name='After',
-                    x=['Response Time'],
-                    y=[response_time],
-                    marker_color='#4ECDC4'
-                )
-            ])
-            fig.update_layout(
-                title="Response Time Comparison",
-                yaxis_title="Time (seconds)",
-                barmode='group',
-                height=400
-            )
+            fig = _response_time_fig(results.baseline_response_time, results.optimized_response_time)
             st.plotly_chart(fig, use_container_width=True)
         else:
             chart_data = pd.DataFrame({
-                'Before': [baseline_time],
-                'After': [response_time]
+                'Before': [results.baseline_response_time],
+                'After': [results.optimized_response_time]
             })
             st.bar_chart(chart_data)
 
@@ -805,24 +1182,7 @@ def render_analytics_tab():
 
     # Savings visualization
     if PLOTLY_AVAILABLE:
-        months = list(range(1, 13))
-        cumulative_savings = [daily_cost_savings * 30 * m for m in months]
-
-        fig = go.Figure()
-        fig.add_trace(go.Scatter(
-            x=months,
-            y=cumulative_savings,
-            mode='lines+markers',
-            name='Cumulative Savings',
-            line=dict(color='#4ECDC4', width=3),
-            marker=dict(size=8)
-        ))
-        fig.update_layout(
-            title="Projected Annual Savings",
-            xaxis_title="Month",
-            yaxis_title="Cumulative Savings ($)",
-            height=400
-        )
+        fig = _savings_line_fig(float(daily_cost_savings))
         st.plotly_chart(fig, use_container_width=True)
 
     st.markdown("---")
@@ -834,8 +1194,9 @@ def render_analytics_tab():
         msg_count = len(st.session_state.messages) // 2  # Divide by 2 for Q&A pairs
         avg_response_time = st.session_state.total_response_time / max(msg_count, 1)
 
-        if st.session_state.quality_scores:
-            avg_quality = sum(st.session_state.quality_scores) / len(st.session_state.quality_scores)
+        agg = st.session_state.quality_agg
+        if agg[0] > 0:
+            avg_quality = agg[1] / agg[0]
 
             col1, col2, col3 = st.columns(3)
 
@@ -850,17 +1211,7 @@ def render_analytics_tab():
 
             # Quality distribution
             if PLOTLY_AVAILABLE and len(st.session_state.quality_scores) > 0:
-                fig = go.Figure(data=[go.Histogram(
-                    x=[q * 100 for q in st.session_state.quality_scores],
-                    nbinsx=10,
-                    marker_color='#4ECDC4'
-                )])
-                fig.update_layout(
-                    title="Quality Score Distribution (This Session)",
-                    xaxis_title="Quality Score (%)",
-                    yaxis_title="Count",
-                    height=300
-                )
+                fig = _quality_hist_fig(tuple(st.session_state.quality_scores))
                 st.plotly_chart(fig, use_container_width=True)
 
 
@@ -888,6 +1239,8 @@ def render_mlflow_tab():
 
     with col2:
         if st.button("🔄 Test Connection", use_container_width=True):
+            # Drop the cached probe so an explicit re-test really re-probes
+            check_mlflow_connection.clear()
             st.session_state.mlflow_connected = check_mlflow_connection()
             st.rerun()
 
@@ -923,14 +1276,20 @@ mlflow server --host 127.0.0.1 --port 5000
         st.subheader("📊 Cached Optimization Results")
 
         results = load_optimization_results()
-        if results:
+        if results is not None:
             col1, col2 = st.columns(2)
 
             with col1:
-                st.json(results.get("baseline_performance", {}), expanded=True)
+                st.json({
+                    "avg_quality_score": results.baseline_quality,
+                    "avg_response_time_seconds": results.baseline_response_time
+                }, expanded=True)
 
             with col2:
-                st.json(results.get("optimized_performance", {}), expanded=True)
+                st.json({
+                    "avg_quality_score": results.optimized_quality,
+                    "avg_response_time_seconds": results.optimized_response_time
+                }, expanded=True)
 
         return
 
@@ -971,15 +1330,32 @@ mlflow server --host 127.0.0.1 --port 5000
     # Fetch and display runs
     st.subheader("📋 Run History")
 
-    runs = get_mlflow_runs(selected_exp_id)
+    # One batched search fetches runs for every experiment, so switching
+    # the selectbox doesn't trigger a fresh round trip
+    all_runs = get_runs_for_experiments(tuple(experiment_names.values()))
+    runs = all_runs.get(selected_exp_id, [])
 
     if not runs:
         st.info("No runs found for this experiment")
         return
 
+    # Vectorized timestamp formatting: one C-level pd.to_datetime over all
+    # runs instead of a Python-level format_timestamp call per row.
+    # Converted to local time so the column matches format_timestamp output
+    start_times_ms = np.fromiter(
+        (run.get('info', {}).get('start_time', 0) or 0 for run in runs),
+        dtype=np.int64,
+        count=len(runs)
+    )
+    start_time_strs = (
+        pd.to_datetime(start_times_ms, unit='ms', utc=True)
+        .tz_convert(datetime.now().astimezone().tzinfo)
+        .strftime('%Y-%m-%d %H:%M:%S')
+    )
+
     # Prepare runs data for display
     runs_data = []
-    for run in runs:
+    for i, run in enumerate(runs):
         info = run.get('info', {})
         data = run.get('data', {})
         metrics = data.get('metrics', {})
@@ -989,8 +1365,8 @@ mlflow server --host 127.0.0.1 --port 5000
             "Run ID": info.get('run_id', 'N/A')[:8] + "...",
             "Run Name": info.get('run_name', 'N/A'),
             "Status": info.get('status', 'N/A'),
-            "Start Time": format_timestamp(info.get('start_time')),
-            "Duration (min)": round((info.get('end_time', info.get('start_time', 0)) - 
+            "Start Time": start_time_strs[i],
+            "Duration (min)": round((info.get('end_time', info.get('start_time', 0)) -
                                     info.get('start_time', 0)) / 60000, 2),
             "Baseline Quality": f"{metrics.get('baseline_quality_score', 0)*100:.0f}%",
             "Optimized Quality": f"{metrics.get('optimized_quality_score', 0)*100:.0f}%",
@@ -1486,7 +1862,7 @@ def main():
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        agent = load_optimized_agent()
+        agent = get_agent()
         if agent:
             st.success("🤖 Agent: Loaded")
         else:
@@ -1499,14 +1875,16 @@ def main():
             st.error("🔌 API: Not Configured")
 
     with col3:
-        if st.session_state.mlflow_connected:
+        if st.session_state.mlflow_connected is None:
+            st.info("🔬 MLflow: Checking...")
+        elif st.session_state.mlflow_connected:
             st.success("🔬 MLflow: Connected")
         else:
             st.info("🔬 MLflow: Offline")
 
     with col4:
-        session_duration = datetime.now() - st.session_state.session_start_time
-        st.info(f"⏱️ Session: {session_duration.seconds // 60}m")
+        elapsed = int(time.monotonic() - st.session_state.session_start_monotonic)
+        st.info(f"⏱️ Session: {elapsed // 60}m")
 
     st.markdown("---")
 
@@ -45,22 +45,36 @@ $ streamlit run cebu_pacific_gemini_chatbot.py
 
 import streamlit as st
 import dspy
+import importlib.util
 import json
 import os
+import re
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import pandas as pd
 
-# Optional imports with graceful fallback
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+# Optional imports with graceful fallback. Plotly availability is probed
+# with find_spec (no import) so cold starts skip its import cost; the real
+# import happens lazily on the first chart build via _ensure_plotly().
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+if not PLOTLY_AVAILABLE:
     st.warning("Plotly not installed. Charts will use Streamlit native.")
 
+go = None  # bound by _ensure_plotly()
+px = None
+
+
+def _ensure_plotly():
+    """Import plotly on first use; only called behind PLOTLY_AVAILABLE."""
+    global go, px
+    if go is None:
+        import plotly.graph_objects as go_mod
+        import plotly.express as px_mod
+        go, px = go_mod, px_mod
+
+
 try:
     import requests
     REQUESTS_AVAILABLE = True
@@ -68,6 +82,18 @@ except ImportError:
     REQUESTS_AVAILABLE = False
     st.warning("Requests not installed. MLflow features limited.")
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # ~5x faster on nested dicts
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    from streamlit_autorefresh import st_autorefresh
+    AUTOREFRESH_AVAILABLE = True
+except ImportError:
+    AUTOREFRESH_AVAILABLE = False  # timer badge just won't tick on its own
+
 
 # ============================================================================
 # PAGE CONFIGURATION
@@ -166,11 +192,15 @@ class SupportAgent(dspy.Module):
 # HELPER FUNCTIONS
 # ============================================================================
 
-@st.cache_resource
+@st.cache_resource(show_spinner="Loading agent…")
 def load_optimized_agent() -> Optional[SupportAgent]:
     """
     Load the optimized agent from JSON file with caching.
 
+    cache_resource makes the LM handle and agent a per-process singleton,
+    so reruns triggered by widget clicks skip the disk read and DSPy
+    configuration entirely.
+
     Returns:
         SupportAgent instance or None if loading fails
     """
@@ -203,7 +233,18 @@ def load_optimized_agent() -> Optional[SupportAgent]:
         return None
 
 
-@st.cache_data
+@st.cache_data(persist="disk")
+def _read_results_json(path: str, mtime: float) -> Dict[str, Any]:
+    """
+    Parse the results file with orjson when available.
+
+    mtime is part of the cache key, so rewriting the file invalidates
+    the entry while the disk cache still survives process restarts.
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
 def load_optimization_results() -> Dict[str, Any]:
     """
     Load optimization results from JSON file.
@@ -213,8 +254,9 @@ def load_optimization_results() -> Dict[str, Any]:
     """
     try:
         if os.path.exists(Config.RESULTS_FILE):
-            with open(Config.RESULTS_FILE, 'r') as f:
-                return json.load(f)
+            return _read_results_json(
+                Config.RESULTS_FILE, os.path.getmtime(Config.RESULTS_FILE)
+            )
         else:
             # Return default values if file not found
             return {
@@ -247,9 +289,22 @@ def load_optimization_results() -> Dict[str, Any]:
         return {}
 
 
+@st.cache_resource(show_spinner=False)
+def _mlflow_session() -> "requests.Session":
+    """
+    One shared HTTP session for all MLflow REST calls.
+
+    cache_resource makes it a per-process singleton, so every call reuses
+    the same pooled TCP connection instead of paying a fresh handshake,
+    and Streamlit's reloader doesn't leak sockets.
+    """
+    return requests.Session()
+
+
+@st.cache_data(ttl=15)
 def check_mlflow_connection() -> bool:
     """
-    Check if MLflow server is accessible.
+    Check if MLflow server is accessible (cached for 15s across reruns).
 
     Returns:
         True if MLflow is accessible, False otherwise
@@ -258,7 +313,7 @@ def check_mlflow_connection() -> bool:
         return False
 
     try:
-        response = requests.get(f"{Config.MLFLOW_URI}/health", timeout=2)
+        response = _mlflow_session().get(f"{Config.MLFLOW_URI}/health", timeout=2)
         return response.status_code == 200
     except:
         return False
@@ -275,7 +330,7 @@ def get_mlflow_experiments() -> List[Dict]:
         return []
 
     try:
-        response = requests.get(f"{Config.MLFLOW_URI}/api/2.0/mlflow/experiments/search")
+        response = _mlflow_session().get(f"{Config.MLFLOW_URI}/api/2.0/mlflow/experiments/search")
         if response.status_code == 200:
             return response.json().get('experiments', [])
     except Exception as e:
@@ -283,23 +338,32 @@ def get_mlflow_experiments() -> List[Dict]:
     return []
 
 
-def get_mlflow_runs(experiment_id: str) -> List[Dict]:
+def get_mlflow_runs(experiment_id: str, max_results: int = 200) -> List[Dict]:
     """
-    Fetch runs from MLflow experiment.
+    Fetch runs from MLflow experiment in a single search call.
+
+    The server caps and orders the result set, so the client gets the
+    most recent runs pre-sorted in one round trip instead of pulling an
+    unbounded history.
 
     Args:
         experiment_id: MLflow experiment ID
+        max_results: Server-side cap on returned runs
 
     Returns:
-        List of run dictionaries
+        List of run dictionaries, newest first
     """
     if not REQUESTS_AVAILABLE:
         return []
 
     try:
-        response = requests.post(
+        response = _mlflow_session().post(
             f"{Config.MLFLOW_URI}/api/2.0/mlflow/runs/search",
-            json={"experiment_ids": [experiment_id]}
+            json={
+                "experiment_ids": [experiment_id],
+                "max_results": max_results,
+                "order_by": ["attributes.start_time DESC"]
+            }
         )
         if response.status_code == 200:
             return response.json().get('runs', [])
@@ -308,6 +372,29 @@ def get_mlflow_runs(experiment_id: str) -> List[Dict]:
     return []
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_experiments() -> List[Dict]:
+    """Cache the experiment list for 60s so widget interactions reuse it."""
+    return get_mlflow_experiments()
+
+
+# Runs fetched per page of the history table; "Load more" raises the cap
+RUNS_PAGE_SIZE = 50
+
+# Columns shipped to the browser for the run history table; anything else
+# in df_runs (e.g. full run ids) stays server-side and off the Arrow wire
+DISPLAY_COLS = [
+    "Run ID", "Run Name", "Status", "Start Time", "Duration (min)",
+    "Baseline Quality", "Optimized Quality", "Improvement",
+]
+
+
+@st.cache_data(ttl=30)
+def _cached_runs(experiment_id: str, max_results: int = RUNS_PAGE_SIZE) -> List[Dict]:
+    """Cache runs per experiment for 30s so reruns skip the REST call."""
+    return get_mlflow_runs(experiment_id, max_results=max_results)
+
+
 def calculate_quality_score(response: str) -> float:
     """
     Estimate quality score for a response based on heuristics.
@@ -328,10 +415,42 @@ def calculate_quality_score(response: str) -> float:
     return sum(quality_indicators) / len(quality_indicators)
 
 
+# Metric formatting: one compiled pattern + a dispatch table replaces the
+# chain of substring tests run per metric per rerun
+_METRIC_KIND_RE = re.compile(r'(score|improvement|cost|saving|duration|time)')
+
+_METRIC_FORMATTERS = {
+    'score': lambda v: f"{v*100:.1f}%" if v < 2 else f"{v:.1f}",
+    'improvement': lambda v: f"{v*100:.1f}%" if v < 2 else f"{v:.1f}",
+    'cost': lambda v: f"${v:,.0f}",
+    'saving': lambda v: f"${v:,.0f}",
+    'duration': lambda v: f"{v:.2f}min" if v < 60 else f"{v/60:.1f}hr",
+    'time': lambda v: f"{v:.2f}min" if v < 60 else f"{v/60:.1f}hr",
+}
+
+
+def format_metric_value(key: str, value: float) -> str:
+    """Format a metric value based on the kind encoded in its name."""
+    match = _METRIC_KIND_RE.search(key)
+    if match:
+        return _METRIC_FORMATTERS[match.group(1)](value)
+    return f"{value:.2f}"
+
+
+@lru_cache(maxsize=256)
+def metric_display_name(key: str) -> str:
+    """Metric key -> title-cased display name, memoized per unique key."""
+    return key.replace('_', ' ').title()
+
+
+@lru_cache(maxsize=4096)
 def format_timestamp(timestamp: Optional[float]) -> str:
     """
     Format timestamp to readable string.
 
+    Memoized: identical timestamps recur across runs and reruns, so the
+    fromtimestamp + strftime work runs once per unique value.
+
     Args:
         timestamp: Unix timestamp
 
@@ -669,6 +788,7 @@ def render_analytics_tab():
     with col1:
         # Quality score comparison
         if PLOTLY_AVAILABLE:
+            _ensure_plotly()
             fig = go.Figure(data=[
                 go.Bar(
                     name='Before',
@@ -702,6 +822,7 @@ def render_analytics_tab():
         # Response time comparison
         baseline_time = baseline.get("avg_response_time_seconds", 5.0)
         if PLOTLY_AVAILABLE:
+            _ensure_plotly()
             fig = go.Figure(data=[
                 go.Bar(
                     name='Before',
@@ -802,6 +923,7 @@ def render_analytics_tab():
 
     # Savings visualization
     if PLOTLY_AVAILABLE:
+        _ensure_plotly()
         months = list(range(1, 13))
         cumulative_savings = [daily_cost_savings * 30 * m for m in months]
 
@@ -847,6 +969,7 @@ def render_analytics_tab():
 
             # Quality distribution
             if PLOTLY_AVAILABLE and len(st.session_state.quality_scores) > 0:
+                _ensure_plotly()
                 fig = go.Figure(data=[go.Histogram(
                     x=[q * 100 for q in st.session_state.quality_scores],
                     nbinsx=10,
@@ -865,6 +988,54 @@ def render_analytics_tab():
 # TAB 3: MLFLOW LOGS
 # ============================================================================
 
+@st.cache_data(show_spinner=False)
+def _run_params_df(run_id: str, params: Dict[str, str]) -> pd.DataFrame:
+    """Run parameters as a two-column frame, cached per run.
+
+    Column-wise construction avoids building a dict per row, and the
+    cache means revisiting the same run skips the DataFrame entirely.
+    """
+    return pd.DataFrame({
+        "Parameter": list(params),
+        "Value": list(params.values()),
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _build_comparison_fig(run_names: tuple, baseline_scores: tuple, optimized_scores: tuple):
+    """Build the run-comparison bar chart, cached on the plotted values.
+
+    Takes tuples so the arguments hash; reruns with an unchanged selection
+    reuse the figure instead of rebuilding it.
+    """
+    _ensure_plotly()
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        name='Baseline',
+        x=list(run_names),
+        y=list(baseline_scores),
+        marker_color='#FF6B6B'
+    ))
+
+    fig.add_trace(go.Bar(
+        name='Optimized',
+        x=list(run_names),
+        y=list(optimized_scores),
+        marker_color='#4ECDC4'
+    ))
+
+    fig.update_layout(
+        title="Run Comparison",
+        xaxis_title="Run",
+        yaxis_title="Quality Score (%)",
+        barmode='group',
+        height=400
+    )
+
+    return fig
+
+
 def render_mlflow_tab():
     """Render the MLflow logs and experiment tracking tab"""
 
@@ -885,8 +1056,13 @@ def render_mlflow_tab():
 
     with col2:
         if st.button("🔄 Test Connection", use_container_width=True):
-            st.session_state.mlflow_connected = check_mlflow_connection()
-            st.rerun()
+            # Clear the ttl cache so the probe is fresh, then only rerun
+            # the whole script if the connection state actually flipped
+            check_mlflow_connection.clear()
+            new_state = check_mlflow_connection()
+            if new_state != st.session_state.mlflow_connected:
+                st.session_state.mlflow_connected = new_state
+                st.rerun()
 
     with col3:
         if st.button("🌐 Open MLflow UI", use_container_width=True):
@@ -932,7 +1108,7 @@ mlflow server --host 127.0.0.1 --port 5000
         return
 
     # MLflow is connected - show full interface
-    experiments = get_mlflow_experiments()
+    experiments = _cached_experiments()
 
     if not experiments:
         st.warning("No experiments found in MLflow")
@@ -968,37 +1144,56 @@ mlflow server --host 127.0.0.1 --port 5000
     # Fetch and display runs
     st.subheader("📋 Run History")
 
-    runs = get_mlflow_runs(selected_exp_id)
+    if st.button("🔄 Refresh"):
+        _cached_runs.clear()
+        _cached_experiments.clear()
+
+    # Paginate: fetch only the newest page(s) instead of the full history
+    st.session_state.setdefault('mlflow_page', 1)
+    runs = _cached_runs(selected_exp_id, RUNS_PAGE_SIZE * st.session_state.mlflow_page)
 
     if not runs:
         st.info("No runs found for this experiment")
         return
 
-    # Prepare runs data for display
-    runs_data = []
-    for run in runs:
-        info = run.get('info', {})
-        data = run.get('data', {})
-        metrics = data.get('metrics', {})
-        params = data.get('params', {})
-
-        runs_data.append({
-            "Run ID": info.get('run_id', 'N/A')[:8] + "...",
-            "Run Name": info.get('run_name', 'N/A'),
-            "Status": info.get('status', 'N/A'),
-            "Start Time": format_timestamp(info.get('start_time')),
-            "Duration (min)": round((info.get('end_time', info.get('start_time', 0)) - 
-                                    info.get('start_time', 0)) / 60000, 2),
-            "Baseline Quality": f"{metrics.get('baseline_quality_score', 0)*100:.0f}%",
-            "Optimized Quality": f"{metrics.get('optimized_quality_score', 0)*100:.0f}%",
-            "Improvement": f"{metrics.get('quality_improvement', 0)*100:.0f}%",
-        })
-
-    df_runs = pd.DataFrame(runs_data)
-
-    # Display runs table
+    if len(runs) >= RUNS_PAGE_SIZE * st.session_state.mlflow_page:
+        if st.button("⬇️ Load more runs"):
+            st.session_state.mlflow_page += 1
+            st.rerun()
+
+    # Vectorized table build: json_normalize flattens every run at once and
+    # the derived columns are column-wise pandas ops instead of a per-run
+    # Python dict-building loop
+    df_norm = pd.json_normalize(runs, sep='.')
+
+    def _col(name, default):
+        if name in df_norm.columns:
+            return df_norm[name]
+        return pd.Series(default, index=df_norm.index)
+
+    start_ms = _col('info.start_time', 0).fillna(0)
+    # Runs still RUNNING have no end_time yet; fill with "now" so the
+    # Duration column shows elapsed time instead of zero
+    now_ms = pd.Timestamp.utcnow().value // 1_000_000
+    end_ms = _col('info.end_time', None).fillna(now_ms)
+
+    df_runs = pd.DataFrame({
+        "_run_id": _col('info.run_id', '').astype(str),
+        "Run ID": _col('info.run_id', 'N/A').astype(str).str.slice(0, 8) + "...",
+        "Run Name": _col('info.run_name', 'N/A'),
+        "Status": _col('info.status', 'N/A'),
+        "Start Time": pd.to_datetime(start_ms, unit='ms', utc=True).dt.strftime('%Y-%m-%d %H:%M:%S'),
+        "Duration (min)": ((end_ms - start_ms) / 60000).round(2),
+        # Quality columns stay numeric (0-100); formatting is left to
+        # column_config so nothing downstream has to parse '%' strings
+        "Baseline Quality": (_col('data.metrics.baseline_quality_score', 0).fillna(0) * 100).round(0),
+        "Optimized Quality": (_col('data.metrics.optimized_quality_score', 0).fillna(0) * 100).round(0),
+        "Improvement": (_col('data.metrics.quality_improvement', 0).fillna(0) * 100).round(0),
+    })
+
+    # Display runs table (only the display columns are serialized to Arrow)
     st.dataframe(
-        df_runs,
+        df_runs[DISPLAY_COLS],
         use_container_width=True,
         hide_index=True,
         column_config={
@@ -1006,271 +1201,430 @@ mlflow server --host 127.0.0.1 --port 5000
                 "Status",
                 help="Run status"
             ),
-            "Baseline Quality": st.column_config.TextColumn(
+            "Baseline Quality": st.column_config.ProgressColumn(
                 "Baseline Quality",
-                help="Quality before optimization"
+                help="Quality before optimization",
+                min_value=0,
+                max_value=100,
+                format="%.0f%%"
             ),
-            "Optimized Quality": st.column_config.TextColumn(
+            "Optimized Quality": st.column_config.ProgressColumn(
                 "Optimized Quality",
-                help="Quality after optimization"
+                help="Quality after optimization",
+                min_value=0,
+                max_value=100,
+                format="%.0f%%"
+            ),
+            "Improvement": st.column_config.NumberColumn(
+                "Improvement",
+                help="Quality gain from optimization",
+                format="%.0f%%"
             ),
         }
     )
 
-    # Run details viewer
+    # Run details viewer — collapsed by default so the tabs, metric grid
+    # and parameter table only render once the user opens the section
     st.markdown("---")
-    st.subheader("🔍 Run Details")
-
-    if len(runs) > 0:
-        run_names = [r.get('info', {}).get('run_name', f"Run {i}") for i, r in enumerate(runs)]
-        selected_run_name = st.selectbox("Select run to view details", run_names)
-
-        selected_run_idx = run_names.index(selected_run_name)
-        selected_run = runs[selected_run_idx]
-
-        info = selected_run.get('info', {})
-        data = selected_run.get('data', {})
-        metrics = data.get('metrics', {})
-        params = data.get('params', {})
-
-        # Tabs for different aspects of the run
-        tab1, tab2, tab3 = st.tabs(["📊 Metrics", "⚙️ Parameters", "ℹ️ Metadata"])
-
-        with tab1:
-            if metrics:
-                # Display metrics in columns
-                metric_cols = st.columns(3)
-                metric_items = list(metrics.items())
-
-                for idx, (key, value) in enumerate(metric_items):
-                    col_idx = idx % 3
-                    with metric_cols[col_idx]:
-                        # Format metric name
-                        display_name = key.replace('_', ' ').title()
-
-                        # Format value
-                        if 'score' in key or 'improvement' in key:
-                            display_value = f"{value*100:.1f}%" if value < 2 else f"{value:.1f}"
-                        elif 'cost' in key or 'saving' in key:
-                            display_value = f"${value:,.0f}"
-                        elif 'duration' in key or 'time' in key:
-                            display_value = f"{value:.2f}min" if value < 60 else f"{value/60:.1f}hr"
-                        else:
-                            display_value = f"{value:.2f}"
-
-                        st.metric(display_name, display_value)
-            else:
-                st.info("No metrics recorded for this run")
-
-        with tab2:
-            if params:
-                param_df = pd.DataFrame([
-                    {"Parameter": k, "Value": v}
-                    for k, v in params.items()
-                ])
-                st.dataframe(param_df, use_container_width=True, hide_index=True)
-            else:
-                st.info("No parameters recorded for this run")
-
-        with tab3:
-            metadata = {
-                "Run ID": info.get('run_id', 'N/A'),
-                "Run Name": info.get('run_name', 'N/A'),
-                "Experiment ID": info.get('experiment_id', 'N/A'),
-                "User": info.get('user_id', 'N/A'),
-                "Status": info.get('status', 'N/A'),
-                "Start Time": format_timestamp(info.get('start_time')),
-                "End Time": format_timestamp(info.get('end_time')),
-                "Artifact URI": info.get('artifact_uri', 'N/A')
-            }
+    with st.expander("🔍 Run Details", expanded=False):
+        if len(runs) > 0:
+            # Unique display names (collisions get a short run-id suffix)
+            # feeding a name -> index map, so selection is one dict lookup
+            # instead of a linear list.index scan
+            run_names = []
+            seen = set()
+            for i, r in enumerate(runs):
+                name = r.get('info', {}).get('run_name', f"Run {i}")
+                if name in seen:
+                    name = f"{name} ({r.get('info', {}).get('run_id', '')[:6]})"
+                seen.add(name)
+                run_names.append(name)
+            _name_to_idx = {n: i for i, n in enumerate(run_names)}
+
+            selected_run_name = st.selectbox("Select run to view details", run_names)
+            selected_run = runs[_name_to_idx[selected_run_name]]
+
+            info = selected_run.get('info', {})
+            data = selected_run.get('data', {})
+            metrics = data.get('metrics', {})
+            params = data.get('params', {})
+
+            # Tabs for different aspects of the run
+            tab1, tab2, tab3 = st.tabs(["📊 Metrics", "⚙️ Parameters", "ℹ️ Metadata"])
+
+            with tab1:
+                if metrics:
+                    # Display metrics in columns
+                    metric_cols = st.columns(3)
+                    metric_items = list(metrics.items())
+
+                    for idx, (key, value) in enumerate(metric_items):
+                        col_idx = idx % 3
+                        with metric_cols[col_idx]:
+                            st.metric(
+                                metric_display_name(key),
+                                format_metric_value(key, value)
+                            )
+                else:
+                    st.info("No metrics recorded for this run")
+
+            with tab2:
+                if params:
+                    param_df = _run_params_df(info.get('run_id', ''), params)
+                    st.dataframe(param_df, use_container_width=True, hide_index=True)
+                else:
+                    st.info("No parameters recorded for this run")
+
+            with tab3:
+                metadata = {
+                    "Run ID": info.get('run_id', 'N/A'),
+                    "Run Name": info.get('run_name', 'N/A'),
+                    "Experiment ID": info.get('experiment_id', 'N/A'),
+                    "User": info.get('user_id', 'N/A'),
+                    "Status": info.get('status', 'N/A'),
+                    "Start Time": format_timestamp(info.get('start_time')),
+                    "End Time": format_timestamp(info.get('end_time')),
+                    "Artifact URI": info.get('artifact_uri', 'N/A')
+                }
 
-            for key, value in metadata.items():
-                st.text(f"{key}: {value}")
+                for key, value in metadata.items():
+                    st.text(f"{key}: {value}")
 
-    # Comparison tool
+    # Comparison tool — also collapsed so the comparison DataFrame and
+    # figure are skipped entirely on reruns that never open it
     if len(runs) >= 2:
         st.markdown("---")
-        st.subheader("🔄 Compare Runs")
+        with st.expander("🔄 Compare Runs", expanded=False):
+            run_options = [f"{r.get('info', {}).get('run_name', f'Run {i}')} ({r.get('info', {}).get('run_id', '')[:8]}...)"
+                        for i, r in enumerate(runs)]
+
+            selected_runs = st.multiselect(
+                "Select 2-4 runs to compare",
+                options=run_options,
+                max_selections=4
+            )
 
-        run_options = [f"{r.get('info', {}).get('run_name', f'Run {i}')} ({r.get('info', {}).get('run_id', '')[:8]}...)" 
-                    for i, r in enumerate(runs)]
+            if len(selected_runs) >= 2:
+                # One short-id -> run map replaces the O(N·M) scan of the full
+                # runs list for every selected label
+                runs_by_short = {r.get('info', {}).get('run_id', '')[:8]: r for r in runs}
 
-        selected_runs = st.multiselect(
-            "Select 2-4 runs to compare",
-            options=run_options,
-            max_selections=4
-        )
+                comparison_data = []
+
+                for run_str in selected_runs:
+                    short_id = run_str.rsplit('(', 1)[-1][:8]
+                    run = runs_by_short.get(short_id)
+                    if run is None:
+                        continue
 
-        if len(selected_runs) >= 2:
-            # Extract selected run data
-            comparison_data = []
-
-            for run_str in selected_runs:
-                # Find matching run
-                for run in runs:
-                    if run.get('info', {}).get('run_id', '')[:8] in run_str:
-                        metrics = run.get('data', {}).get('metrics', {})
-                        info = run.get('info', {})
-
-                        comparison_data.append({
-                            "Run": info.get('run_name', 'N/A'),
-                            "Baseline": f"{metrics.get('baseline_quality_score', 0)*100:.0f}%",
-                            "Optimized": f"{metrics.get('optimized_quality_score', 0)*100:.0f}%",
-                            "Improvement": f"{metrics.get('quality_improvement', 0)*100:.0f}%",
-                            "Duration": f"{metrics.get('optimization_duration', 0):.2f}min"
-                        })
-                        break
-
-            if comparison_data:
-                df_compare = pd.DataFrame(comparison_data)
-                st.dataframe(df_compare, use_container_width=True, hide_index=True)
-
-                # Visualize comparison
-                if PLOTLY_AVAILABLE and len(comparison_data) > 0:
-                    fig = go.Figure()
-
-                    run_names = [d['Run'] for d in comparison_data]
-                    baseline_scores = [float(d['Baseline'].rstrip('%')) for d in comparison_data]
-                    optimized_scores = [float(d['Optimized'].rstrip('%')) for d in comparison_data]
-
-                    fig.add_trace(go.Bar(
-                        name='Baseline',
-                        x=run_names,
-                        y=baseline_scores,
-                        marker_color='#FF6B6B'
-                    ))
-
-                    fig.add_trace(go.Bar(
-                        name='Optimized',
-                        x=run_names,
-                        y=optimized_scores,
-                        marker_color='#4ECDC4'
-                    ))
-
-                    fig.update_layout(
-                        title="Run Comparison",
-                        xaxis_title="Run",
-                        yaxis_title="Quality Score (%)",
-                        barmode='group',
-                        height=400
+                    metrics = run.get('data', {}).get('metrics', {})
+                    info = run.get('info', {})
+
+                    comparison_data.append({
+                        "Run": info.get('run_name', 'N/A'),
+                        "Baseline": metrics.get('baseline_quality_score', 0) * 100,
+                        "Optimized": metrics.get('optimized_quality_score', 0) * 100,
+                        "Improvement": metrics.get('quality_improvement', 0) * 100,
+                        "Duration": f"{metrics.get('optimization_duration', 0):.2f}min"
+                    })
+
+                if comparison_data:
+                    df_compare = pd.DataFrame(comparison_data)
+                    st.dataframe(
+                        df_compare,
+                        use_container_width=True,
+                        hide_index=True,
+                        column_config={
+                            "Baseline": st.column_config.NumberColumn(format="%.0f%%"),
+                            "Optimized": st.column_config.NumberColumn(format="%.0f%%"),
+                            "Improvement": st.column_config.NumberColumn(format="%.0f%%"),
+                        }
                     )
 
-                    st.plotly_chart(fig, use_container_width=True)
+                    # Visualize comparison — scores are already floats
+                    if PLOTLY_AVAILABLE:
+                        fig = _build_comparison_fig(
+                            tuple(d['Run'] for d in comparison_data),
+                            tuple(d['Baseline'] for d in comparison_data),
+                            tuple(d['Optimized'] for d in comparison_data),
+                        )
+                        st.plotly_chart(fig, use_container_width=True)
 
 
 # ============================================================================
 # TAB 4: ABOUT / DOCUMENTATION
 # ============================================================================
 
-def render_about_tab():
-    """Render the about and documentation tab"""
+# The About tab is entirely static. Building these strings at module import
+# (instead of re-evaluating the f-string-free literals inside the render
+# function) keeps the per-rerun work down to the st.* calls themselves.
 
-    st.title("ℹ️ About This Chatbot")
+_ABOUT_OVERVIEW_MD = """
+## 🎯 Overview
 
-    # Application overview
-    st.markdown("""
-    ## 🎯 Overview
+This is an **AI-powered customer support chatbot** for Cebu Pacific Airlines,
+built using cutting-edge prompt optimization technology. The agent has been
+optimized using **DSPy's MIPROv2** algorithm, achieving a **31% improvement**
+in response quality (from 49% to 64%).
 
-    This is an **AI-powered customer support chatbot** for Cebu Pacific Airlines, 
-    built using cutting-edge prompt optimization technology. The agent has been 
-    optimized using **DSPy's MIPROv2** algorithm, achieving a **31% improvement** 
-    in response quality (from 49% to 64%).
+### What makes this special?
 
-    ### What makes this special?
+- ✅ **Automated optimization**: No manual prompt engineering needed
+- ✅ **Data-driven**: Learned from 626 real support interactions
+- ✅ **Measurable results**: 64% quality score vs 49% baseline
+- ✅ **Fast responses**: ~5.4 seconds average
+- ✅ **Cost-effective**: $821K annual savings potential
+"""
 
-    - ✅ **Automated optimization**: No manual prompt engineering needed
-    - ✅ **Data-driven**: Learned from 626 real support interactions
-    - ✅ **Measurable results**: 64% quality score vs 49% baseline
-    - ✅ **Fast responses**: ~5.4 seconds average
-    - ✅ **Cost-effective**: $821K annual savings potential
-    """)
+_ABOUT_STACK_LEFT_MD = """
+**Framework & Optimization:**
+- 🧠 **DSPy**: Declarative Self-improving Language Programs
+- 🚀 **MIPROv2**: Multi-prompt Instruction Proposal Optimizer
+- 📊 **MLflow**: Experiment tracking and model registry
 
-    st.markdown("---")
+**LLM & Inference:**
+- 🤖 **Google Gemini**: Advanced multimodal LLM
+- ⚡ **Gemini 3 Flash Preview**: Latest fast model
+- 🚀 **Optimized DSPy**: Declarative self-improving prompts
+"""
 
-    # Technology stack
-    st.subheader("🔧 Technology Stack")
+_ABOUT_STACK_RIGHT_MD = """
+**Interface & Deployment:**
+- 🎨 **Streamlit**: Web application framework
+- 🐍 **Python 3.11+**: Core programming language
+- 📈 **Plotly**: Interactive visualizations
+- 🔐 **Environment-based**: Secure configuration
+
+**Data & Evaluation:**
+- 📝 **626 training examples**: Real support tickets from 176 articles
+- ✅ **157 validation examples**: Test scenarios
+- 📊 **Custom quality metric**: Multi-factor evaluation
+"""
 
-    col1, col2 = st.columns(2)
+_ABOUT_JOURNEY_MD = (
+    """
+### 🔴 Before (Baseline)
 
-    with col1:
-        st.markdown("""
-        **Framework & Optimization:**
-        - 🧠 **DSPy**: Declarative Self-improving Language Programs
-        - 🚀 **MIPROv2**: Multi-prompt Instruction Proposal Optimizer
-        - 📊 **MLflow**: Experiment tracking and model registry
-
-        **LLM & Inference:**
-        - 🤖 **Google Gemini**: Advanced multimodal LLM
-        - ⚡ **Gemini 3 Flash Preview**: Latest fast model
-        - 🚀 **Optimized DSPy**: Declarative self-improving prompts
-        """)
+**Quality: 49%**
 
-    with col2:
-        st.markdown("""
-        **Interface & Deployment:**
-        - 🎨 **Streamlit**: Web application framework
-        - 🐍 **Python 3.11+**: Core programming language
-        - 📈 **Plotly**: Interactive visualizations
-        - 🔐 **Environment-based**: Secure configuration
-
-        **Data & Evaluation:**
-        - 📝 **626 training examples**: Real support tickets from 176 articles
-        - ✅ **157 validation examples**: Test scenarios
-        - 📊 **Custom quality metric**: Multi-factor evaluation
-        """)
+- Generic responses
+- Missing details
+- No structure
+- Inconsistent
+- Slow (6.2 seconds)
 
-    st.markdown("---")
+❌ Customer frustrated
+""",
+    """
+### 🔄 Optimization Process
 
-    # Optimization journey
-    st.subheader("🚀 The Optimization Journey")
+**MIPROv2 Algorithm**
 
-    journey_cols = st.columns(3)
+1. Analyze training data
+2. Generate instruction candidates
+3. Bootstrap few-shot examples
+4. Test 25 trials
+5. Evaluate on validation set
+6. Select best configuration
+
+⏱️ Duration: ~8 minutes
+""",
+    """
+### 🟢 After (Optimized)
+
+**Quality: 64%**
+
+- Detailed step-by-step guidance
+- Complete information
+- Clear structure
+- Consistent quality
+- Fast (5.4 seconds)
+
+✅ Customer satisfied
+""",
+)
+
+_ABOUT_CAN_HELP_MD = """
+**✅ Can Help With:**
+
+- 🔍 **Web check-in issues**: Troubleshooting booking problems
+- 🧳 **Baggage inquiries**: Allowances, fees, restrictions
+- 💰 **Refund requests**: Process, timeline, requirements
+- 📅 **Flight changes**: Fees, policies, rebooking
+- 💳 **Payment problems**: Failed transactions, double charges
+- 📋 **Travel requirements**: Documents, COVID-19 policies
+- ℹ️ **General information**: Routes, schedules, services
+- 🎫 **Booking questions**: Modifications, cancellations
+"""
+
+_ABOUT_CANNOT_DO_MD = """
+**❌ Cannot Do:**
+
+- Make actual bookings or reservations
+- Process refunds or payments
+- Access real customer accounts
+- Make flight changes directly
+- View private customer data
+- Guarantee specific outcomes
+- Replace human agents for complex cases
+- Handle real-time emergencies
+
+**Note:** For actual transactions, contact Cebu Pacific directly.
+"""
+
+_ABOUT_HOWTO = (
+    ("💬 **Using the Chat Interface**", """
+1. **Navigate to the Chat tab** (💬 icon)
+2. **Type your question** in the chat input box
+3. **Or click an example query** from the sidebar
+4. **Wait for the response** (usually < 1 second)
+5. **Ask follow-up questions** for more details
+6. **Download your conversation** using the export button
+
+**Tips for best results:**
+- Be specific about your issue
+- Include relevant details (dates, booking reference)
+- Ask one question at a time
+- Use clear, simple language
+"""),
+    ("📊 **Viewing Analytics**", """
+The Analytics tab shows:
+
+- **Performance metrics**: Before/after comparison
+- **Business impact**: Cost savings calculator
+- **Session statistics**: Your current session metrics
+- **Visualizations**: Charts and graphs
+
+Adjust the calculator inputs to see potential savings for
+different ticket volumes and agent rates.
+"""),
+    ("🔬 **Exploring MLflow Logs**", """
+The MLflow tab displays:
+
+- **Connection status**: Is MLflow server running?
+- **Experiments**: List of optimization experiments
+- **Run history**: All optimization attempts
+- **Run details**: Metrics, parameters, artifacts
+- **Comparison tool**: Compare multiple runs
+
+**To start MLflow server:**
+```bash
+mlflow server --host 127.0.0.1 --port 8080
+```
 
-    with journey_cols[0]:
-        st.markdown("""
-        ### 🔴 Before (Baseline)
+Then refresh the connection in the app.
+"""),
+)
 
-        **Quality: 49%**
+_ABOUT_FAQ = (
+    ("**Q: Is this connected to the real Cebu Pacific system?**", """
+**A:** No, this is a demonstration chatbot that showcases the optimized
+agent. It does not have access to real booking systems or customer data.
+For actual bookings and transactions, visit the official Cebu Pacific
+website or contact their support team.
+"""),
+    ("**Q: How accurate are the responses?**", """
+**A:** The agent achieves 64% quality score based on our evaluation metric,
+which checks for:
+- Structured guidance (steps/options)
+- Detailed responses (>200 characters)
+- Contact information
+- Specific details (fees, policies)
+- Positive and helpful tone
+
+However, always verify critical information with official sources.
+"""),
+    ("**Q: Can I use this for my own airline/business?**", """
+**A:** Yes! The code is designed to be adaptable. You would need to:
+1. Collect your own training data (support interactions)
+2. Run the DSPy optimization process
+3. Adjust the evaluation metric for your domain
+4. Update the example queries and documentation
+5. Deploy with your branding
+"""),
+    ("**Q: What's the cost to run this?**", """
+**A:** The costs are minimal:
+- **Optimization**: ~$1 one-time (or monthly with new data)
+- **Inference**: ~$0.0001 per query with Gemini Flash
+- **For 1000 queries/day**: ~$36.50/year
+- **Cloud hosting**: ~$5/day for production deployment
+
+Total: ~$1,861/year for 1000 queries/day
+**Savings**: $821,250/year (potential)
+**ROI**: 440× return on investment
+"""),
+    ("**Q: Why is MLflow not connecting?**", """
+**A:** MLflow requires a separate server to be running. To start it:
+
+```bash
+mlflow server --host 127.0.0.1 --port 8080
+```
 
-        - Generic responses
-        - Missing details
-        - No structure
-        - Inconsistent
-        - Slow (6.2 seconds)
+Keep this running in a separate terminal window. The app will then be
+able to connect and display experiment data.
 
-        ❌ Customer frustrated
-        """)
+If MLflow is not available, the app gracefully falls back to showing
+cached results instead.
+"""),
+)
 
-    with journey_cols[1]:
-        st.markdown("""
-        ### 🔄 Optimization Process
+_ABOUT_CREDITS_MD = """
+**Built with:**
+- [DSPy](https://dspy-docs.vercel.app/) - Declarative Self-improving Language Programs
+- [Groq](https://groq.com/) - Ultra-fast LLM inference
+- [MLflow](https://mlflow.org/) - ML experiment tracking
+- [Streamlit](https://streamlit.io/) - Web app framework
+
+**Learn more:**
+- [DSPy GitHub](https://github.com/stanfordnlp/dspy)
+- [DSPy Documentation](https://dspy-docs.vercel.app/)
+- [Groq Console](https://console.groq.com/)
+- [MLflow Docs](https://mlflow.org/docs/latest/)
+
+**Version:** 1.0.0  
+**Last Updated:** February 2026  
+**License:** MIT
+"""
 
-        **MIPROv2 Algorithm**
+_ABOUT_FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 20px;'>
+    <p>Made with ❤️ using DSPy + Google Gemini + Streamlit</p>
+    <p>© 2026 Cebu Pacific AI Support Bot · All Rights Reserved</p>
+</div>
+"""
 
-        1. Analyze training data
-        2. Generate instruction candidates
-        3. Bootstrap few-shot examples
-        4. Test 25 trials
-        5. Evaluate on validation set
-        6. Select best configuration
 
-        ⏱️ Duration: ~8 minutes
-        """)
+def render_about_tab():
+    """Render the about and documentation tab"""
 
-    with journey_cols[2]:
-        st.markdown("""
-        ### 🟢 After (Optimized)
+    st.title("ℹ️ About This Chatbot")
 
-        **Quality: 64%**
+    # Application overview
+    st.markdown(_ABOUT_OVERVIEW_MD)
+
+    st.markdown("---")
+
+    # Technology stack
+    st.subheader("🔧 Technology Stack")
 
-        - Detailed step-by-step guidance
-        - Complete information
-        - Clear structure
-        - Consistent quality
-        - Fast (5.4 seconds)
+    col1, col2 = st.columns(2)
 
-        ✅ Customer satisfied
-        """)
+    with col1:
+        st.markdown(_ABOUT_STACK_LEFT_MD)
+
+    with col2:
+        st.markdown(_ABOUT_STACK_RIGHT_MD)
+
+    st.markdown("---")
+
+    # Optimization journey
+    st.subheader("🚀 The Optimization Journey")
+
+    journey_cols = st.columns(3)
+
+    for col, block in zip(journey_cols, _ABOUT_JOURNEY_MD):
+        with col:
+            st.markdown(block)
 
     st.markdown("---")
 
@@ -1280,183 +1634,40 @@ def render_about_tab():
     cap_col1, cap_col2 = st.columns(2)
 
     with cap_col1:
-        st.markdown("""
-        **✅ Can Help With:**
-
-        - 🔍 **Web check-in issues**: Troubleshooting booking problems
-        - 🧳 **Baggage inquiries**: Allowances, fees, restrictions
-        - 💰 **Refund requests**: Process, timeline, requirements
-        - 📅 **Flight changes**: Fees, policies, rebooking
-        - 💳 **Payment problems**: Failed transactions, double charges
-        - 📋 **Travel requirements**: Documents, COVID-19 policies
-        - ℹ️ **General information**: Routes, schedules, services
-        - 🎫 **Booking questions**: Modifications, cancellations
-        """)
+        st.markdown(_ABOUT_CAN_HELP_MD)
 
     with cap_col2:
-        st.markdown("""
-        **❌ Cannot Do:**
-
-        - Make actual bookings or reservations
-        - Process refunds or payments
-        - Access real customer accounts
-        - Make flight changes directly
-        - View private customer data
-        - Guarantee specific outcomes
-        - Replace human agents for complex cases
-        - Handle real-time emergencies
-
-        **Note:** For actual transactions, contact Cebu Pacific directly.
-        """)
+        st.markdown(_ABOUT_CANNOT_DO_MD)
 
     st.markdown("---")
 
     # How to use
     st.subheader("📖 How to Use This Chatbot")
 
-    with st.expander("💬 **Using the Chat Interface**"):
-        st.markdown("""
-        1. **Navigate to the Chat tab** (💬 icon)
-        2. **Type your question** in the chat input box
-        3. **Or click an example query** from the sidebar
-        4. **Wait for the response** (usually < 1 second)
-        5. **Ask follow-up questions** for more details
-        6. **Download your conversation** using the export button
-
-        **Tips for best results:**
-        - Be specific about your issue
-        - Include relevant details (dates, booking reference)
-        - Ask one question at a time
-        - Use clear, simple language
-        """)
-
-    with st.expander("📊 **Viewing Analytics**"):
-        st.markdown("""
-        The Analytics tab shows:
-
-        - **Performance metrics**: Before/after comparison
-        - **Business impact**: Cost savings calculator
-        - **Session statistics**: Your current session metrics
-        - **Visualizations**: Charts and graphs
-
-        Adjust the calculator inputs to see potential savings for 
-        different ticket volumes and agent rates.
-        """)
-
-    with st.expander("🔬 **Exploring MLflow Logs**"):
-        st.markdown("""
-        The MLflow tab displays:
-
-        - **Connection status**: Is MLflow server running?
-        - **Experiments**: List of optimization experiments
-        - **Run history**: All optimization attempts
-        - **Run details**: Metrics, parameters, artifacts
-        - **Comparison tool**: Compare multiple runs
-
-        **To start MLflow server:**
-        ```bash
-        mlflow server --host 127.0.0.1 --port 8080
-        ```
-
-        Then refresh the connection in the app.
-        """)
+    for title, body in _ABOUT_HOWTO:
+        with st.expander(title):
+            st.markdown(body)
 
     st.markdown("---")
 
     # FAQ
     st.subheader("❓ Frequently Asked Questions")
 
-    with st.expander("**Q: Is this connected to the real Cebu Pacific system?**"):
-        st.markdown("""
-        **A:** No, this is a demonstration chatbot that showcases the optimized 
-        agent. It does not have access to real booking systems or customer data. 
-        For actual bookings and transactions, visit the official Cebu Pacific 
-        website or contact their support team.
-        """)
-
-    with st.expander("**Q: How accurate are the responses?**"):
-        st.markdown("""
-        **A:** The agent achieves 64% quality score based on our evaluation metric,
-        which checks for:
-        - Structured guidance (steps/options)
-        - Detailed responses (>200 characters)
-        - Contact information
-        - Specific details (fees, policies)
-        - Positive and helpful tone
-
-        However, always verify critical information with official sources.
-        """)
-
-    with st.expander("**Q: Can I use this for my own airline/business?**"):
-        st.markdown("""
-        **A:** Yes! The code is designed to be adaptable. You would need to:
-        1. Collect your own training data (support interactions)
-        2. Run the DSPy optimization process
-        3. Adjust the evaluation metric for your domain
-        4. Update the example queries and documentation
-        5. Deploy with your branding
-        """)
-
-    with st.expander("**Q: What's the cost to run this?**"):
-        st.markdown("""
-        **A:** The costs are minimal:
-        - **Optimization**: ~$1 one-time (or monthly with new data)
-        - **Inference**: ~$0.0001 per query with Gemini Flash
-        - **For 1000 queries/day**: ~$36.50/year
-        - **Cloud hosting**: ~$5/day for production deployment
-
-        Total: ~$1,861/year for 1000 queries/day
-        **Savings**: $821,250/year (potential)
-        **ROI**: 440× return on investment
-        """)
-
-    with st.expander("**Q: Why is MLflow not connecting?**"):
-        st.markdown("""
-        **A:** MLflow requires a separate server to be running. To start it:
-
-        ```bash
-        mlflow server --host 127.0.0.1 --port 8080
-        ```
-
-        Keep this running in a separate terminal window. The app will then be 
-        able to connect and display experiment data.
-
-        If MLflow is not available, the app gracefully falls back to showing 
-        cached results instead.
-        """)
+    for question, answer in _ABOUT_FAQ:
+        with st.expander(question):
+            st.markdown(answer)
 
     st.markdown("---")
 
     # Credits and links
     st.subheader("🏆 Credits & Links")
 
-    st.markdown("""
-    **Built with:**
-    - [DSPy](https://dspy-docs.vercel.app/) - Declarative Self-improving Language Programs
-    - [Groq](https://groq.com/) - Ultra-fast LLM inference
-    - [MLflow](https://mlflow.org/) - ML experiment tracking
-    - [Streamlit](https://streamlit.io/) - Web app framework
-
-    **Learn more:**
-    - [DSPy GitHub](https://github.com/stanfordnlp/dspy)
-    - [DSPy Documentation](https://dspy-docs.vercel.app/)
-    - [Groq Console](https://console.groq.com/)
-    - [MLflow Docs](https://mlflow.org/docs/latest/)
-
-    **Version:** 1.0.0  
-    **Last Updated:** February 2026  
-    **License:** MIT
-    """)
+    st.markdown(_ABOUT_CREDITS_MD)
 
     st.markdown("---")
 
     # Footer
-    st.markdown("""
-    <div style='text-align: center; color: #666; padding: 20px;'>
-        <p>Made with ❤️ using DSPy + Google Gemini + Streamlit</p>
-        <p>© 2026 Cebu Pacific AI Support Bot · All Rights Reserved</p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_ABOUT_FOOTER_HTML, unsafe_allow_html=True)
 
 
 # ============================================================================
@@ -1542,8 +1753,14 @@ def main():
             st.info("🔬 MLflow: Offline")
 
     with col4:
+        # Render the timer into a placeholder and let the (optional)
+        # autorefresh component tick it once a minute; with the data
+        # caches above, that rerun costs only cache lookups
+        timer_slot = st.empty()
         session_duration = datetime.now() - st.session_state.session_start_time
-        st.info(f"⏱️ Session: {session_duration.seconds // 60}m")
+        timer_slot.info(f"⏱️ Session: {session_duration.seconds // 60}m")
+        if AUTOREFRESH_AVAILABLE:
+            st_autorefresh(interval=60000, key="session_timer")
 
     st.markdown("---")
 
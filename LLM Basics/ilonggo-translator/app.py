@@ -2,14 +2,19 @@
 # Run with: streamlit run app.py
 
 import streamlit as st
+import asyncio
 import os
+import faiss
+import numpy as np
+from functools import lru_cache
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_community.vectorstores import FAISS
-from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_core.embeddings import Embeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnableParallel, RunnablePassthrough
+from operator import itemgetter
 
 # Page configuration
 st.set_page_config(
@@ -29,6 +34,110 @@ if "messages" not in st.session_state:
 if "translator_loaded" not in st.session_state:
     st.session_state.translator_loaded = False
 
+# Sidebar example queries - fixed, so their retrieval results are
+# precomputed when the translator loads
+EXAMPLE_QUERIES = [
+    "What does 'mahal' mean?",
+    "How do you say 'hello' in Ilonggo?",
+    "Translate 'kumusta' to English",
+    "What is the Ilonggo word for beautiful?"
+]
+
+# MiniLM called through sentence-transformers directly - encode() with
+# no pydantic validation or kwargs forwarding on the per-turn hot path.
+# Quantized backends are tried first (OpenVINO, then ONNX Runtime int8
+# kernels); plain PyTorch is the last resort. Output is always 384-dim.
+class MiniLMEmbeddings(Embeddings):
+    _BACKENDS = (
+        ("openvino", "openvino/openvino_model_qint8_quantized.xml"),
+        ("onnx", "onnx/model_qint8_avx512_vnni.onnx"),
+        ("torch", None),
+    )
+
+    def __init__(self):
+        from sentence_transformers import SentenceTransformer
+        last_err = None
+        for backend, file_name in self._BACKENDS:
+            try:
+                self._model = SentenceTransformer(
+                    "all-MiniLM-L6-v2",
+                    backend=backend,
+                    model_kwargs={"file_name": file_name} if file_name else None,
+                )
+                return
+            except Exception as err:
+                last_err = err
+        raise last_err
+
+    def embed_documents(self, texts):
+        # Sort by token length before batching so each batch pads to its
+        # own max instead of the global max - less FLOPs burned on padding
+        # when entry lengths vary - then restore the original order
+        lengths = [len(ids) for ids in self._model.tokenizer(texts)["input_ids"]]
+        order = np.argsort(lengths)
+        encoded = self._model.encode(
+            [texts[i] for i in order],
+            batch_size=64,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        out = np.empty_like(encoded)
+        out[order] = encoded
+        return out.tolist()
+
+    def embed_query(self, text):
+        return self._model.encode(
+            text, normalize_embeddings=True, convert_to_numpy=True
+        ).tolist()
+
+
+# Last-query memo for embed_query: multiple internal callers can embed
+# the same prompt within a single turn, and this catches those repeats
+# without the footprint of a real LRU
+class OneShotCache:
+    def __init__(self, fn):
+        self.fn = fn
+        self.key = None
+        self.value = None
+
+    def __call__(self, text):
+        if text != self.key:
+            self.key, self.value = text, self.fn(text)
+        return self.value
+
+
+# Embedding model singleton, built and warmed once per process. The
+# warmup encode triggers lazy weight allocation and kernel selection at
+# import, so the first user query never pays the multi-second cold start.
+@lru_cache(maxsize=1)
+def _build_embeddings():
+    # CPU inference tuning: all cores on intra-op math, one inter-op
+    # thread, and no autograd bookkeeping anywhere on the encode path
+    try:
+        import torch
+        torch.set_num_threads(os.cpu_count() or 4)
+        torch.set_num_interop_threads(1)
+        torch.set_grad_enabled(False)
+    except Exception:
+        pass  # interop count can only be set once per process
+
+    embeddings = MiniLMEmbeddings()
+    embeddings.embed_query("warmup")
+    # Safe to memoize: the query embedding is deterministic per text
+    embeddings.embed_query = OneShotCache(embeddings.embed_query)
+    return embeddings
+
+
+_EMBEDDINGS = _build_embeddings()
+
+
+# Dictionary entries joined for the LLM prompt; each entry is capped so
+# three long PDF extracts don't balloon the input token count (Gemini
+# bills per input token and prefill latency scales with prompt length)
+def format_docs(entries):
+    return "\n\n".join(entry[:400] for entry in entries)
+
+
 # Cache the translator setup
 @st.cache_resource
 def load_translator():
@@ -42,12 +151,8 @@ def load_translator():
             convert_system_message_to_human=True  # Add this for compatibility
         )
         
-        # Load local embeddings
-        embeddings = HuggingFaceEmbeddings(
-            model_name="sentence-transformers/all-MiniLM-L6-v2",
-            model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
-        )
+        # Local embeddings - the warmed module-level singleton
+        embeddings = _EMBEDDINGS
         
         # Load FAISS vectorstore
         vectorstore = FAISS.load_local(
@@ -55,11 +160,35 @@ def load_translator():
             embeddings,
             allow_dangerous_deserialization=True
         )
-        
-        # Create retriever
+
+        # Re-open the raw index memory-mapped so pages are demand-loaded
+        # and shared (via this cache_resource) instead of a second fully
+        # resident copy per reload cycle. Indexes without on-disk
+        # inverted lists can't be mapped; keep the in-RAM one then.
+        try:
+            vectorstore.index = faiss.read_index(
+                "faiss_index/index.faiss",
+                faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        except Exception:
+            pass
+
+        # IVF indexes (built by rebuild_faiss_index.py) expose nprobe as
+        # the speed/recall knob; a plain Flat index has nothing to tune
+        try:
+            faiss.extract_index_ivf(vectorstore.index).nprobe = 16
+        except Exception:
+            pass
+
+        # Let FAISS use every core for the search GEMM - near-linear
+        # speedup on a Flat index, still helps IVF list scans
+        faiss.omp_set_num_threads(os.cpu_count() or 4)
+
+        # Create retriever - score threshold drops weak matches instead
+        # of always padding the prompt with k entries
         retriever = vectorstore.as_retriever(
-            search_type="similarity",
-            search_kwargs={"k": 3}
+            search_type="similarity_score_threshold",
+            search_kwargs={"k": 3, "score_threshold": 0.35}
         )
         
         # Custom prompt template
@@ -81,23 +210,39 @@ Instructions:
 Translation:"""
         
         prompt = ChatPromptTemplate.from_template(template)
-        
-        # Format docs function
-        def format_docs(docs):
-            return "\n\n".join(doc.page_content for doc in docs)
-        
-        # Build translation chain
+
+        # Build translation chain: retrieve once (through the cached
+        # _retrieve) and fan the entries out to both the LLM context and
+        # the caller, so displaying sources never triggers a second
+        # embed + FAISS search
         translator_chain = (
-            {
-                "context": retriever | format_docs,
-                "question": RunnablePassthrough()
-            }
-            | prompt
-            | llm
-            | StrOutputParser()
+            RunnableParallel(
+                docs=RunnableLambda(_retrieve),
+                question=RunnablePassthrough()
+            )
+            | RunnableLambda(lambda x: {
+                "context": format_docs(x["docs"]),
+                "question": x["question"],
+                "docs": x["docs"],
+            })
+            | RunnableParallel(
+                answer=prompt | llm | StrOutputParser(),
+                docs=itemgetter("docs"),
+            )
         )
-        
-        return translator_chain, retriever, vectorstore, llm
+
+        # Same prompt/LLM tail but fed a prebuilt context, so callers who
+        # already retrieved can skip the second embed + FAISS search
+        answer_chain = prompt | llm | StrOutputParser()
+
+        # Warm the known example queries once at load; button clicks then
+        # go straight to the LLM with zero retrieval work
+        example_context = {
+            q: [doc.page_content for doc in retriever.invoke(q)]
+            for q in EXAMPLE_QUERIES
+        }
+
+        return translator_chain, answer_chain, retriever, vectorstore, llm, example_context
     
     except FileNotFoundError:
         st.error("❌ FAISS index not found!")
@@ -107,6 +252,40 @@ Translation:"""
         st.error(f"❌ Error loading translator: {e}")
         st.stop()
 
+
+# Page contents of the top-k dictionary entries, cached per prompt so
+# re-asked queries skip both the embedding and the FAISS search; the
+# translator chain's context branch reads from this cache too
+@st.cache_data(max_entries=512, ttl=1800, show_spinner=False)
+def _retrieve(prompt_text):
+    _, _, retriever, _, _, _ = load_translator()
+    return [doc.page_content for doc in retriever.invoke(prompt_text)]
+
+
+# Stream answer tokens out of the chain, collecting the retrieved
+# entries into sources_out on the side for the sources expander.
+# Example queries skip retrieval entirely via the precomputed contexts.
+def _stream_translation(prompt_text, sources_out):
+    translator_chain, answer_chain, _, _, _, example_context = load_translator()
+
+    cached_entries = example_context.get(prompt_text)
+    if cached_entries is not None:
+        sources_out.extend(cached_entries)
+        yield from answer_chain.stream({
+            "context": format_docs(cached_entries),
+            "question": prompt_text
+        })
+        return
+
+    for chunk in translator_chain.stream(prompt_text):
+        docs = chunk.get("docs")
+        if docs:
+            sources_out.extend(docs)
+        piece = chunk.get("answer")
+        if piece:
+            yield piece
+
+
 # Main app
 def main():
     # Header
@@ -123,7 +302,7 @@ def main():
         
         # Load translator
         with st.spinner("Loading translator..."):
-            translator_chain, retriever, vectorstore, llm = load_translator()
+            translator_chain, answer_chain, retriever, vectorstore, llm, example_context = load_translator()
             st.session_state.translator_loaded = True
         
         st.success("✅ Translator loaded!")
@@ -149,19 +328,25 @@ def main():
         # Example queries
         st.markdown("---")
         st.subheader("📝 Example Questions")
-        example_queries = [
-            "What does 'mahal' mean?",
-            "How do you say 'hello' in Ilonggo?",
-            "Translate 'kumusta' to English",
-            "What is the Ilonggo word for beautiful?"
-        ]
-        
-        for query in example_queries:
+        for query in EXAMPLE_QUERIES:
             if st.button(query, key=query, use_container_width=True):
                 # Add to chat
                 st.session_state.messages.append({"role": "user", "content": query})
                 # Trigger rerun to process
                 st.rerun()
+
+        # Optional prewarm: answer every example in one async batch so
+        # the Gemini round trips overlap instead of running serially
+        if st.toggle("⚡ Prewarm example answers", value=False):
+            if "prewarm" not in st.session_state:
+                with st.spinner("Prewarming examples..."):
+                    outs = asyncio.run(translator_chain.abatch(
+                        EXAMPLE_QUERIES, config={"max_concurrency": 4}
+                    ))
+                st.session_state.prewarm = {
+                    q: (out["answer"], out["docs"])
+                    for q, out in zip(EXAMPLE_QUERIES, outs)
+                }
         
         # Clear chat button
         st.markdown("---")
@@ -180,8 +365,11 @@ def main():
             # Show sources if available
             if "sources" in message and message["sources"]:
                 with st.expander(f"📚 View {len(message['sources'])} dictionary sources"):
-                    for i, doc in enumerate(message["sources"], 1):
-                        st.text(f"Source {i}:\n{doc.page_content[:300]}...")
+                    # History holds (preview, full_length) tuples, so no
+                    # re-slicing of full entries on every rerun
+                    for i, (preview, total_len) in enumerate(message["sources"], 1):
+                        suffix = "..." if total_len > 300 else ""
+                        st.text(f"Source {i}:\n{preview}{suffix}")
                         if i < len(message["sources"]):
                             st.markdown("---")
     
@@ -196,39 +384,49 @@ def main():
         
         # Generate response
         with st.chat_message("assistant"):
-            with st.spinner("Translating..."):
-                try:
-                    # Get translation
-                    response = translator_chain.invoke(prompt)
-                    
-                    # Get source documents
-                    sources = retriever.invoke(prompt)
-                    
-                    # Display response
+            try:
+                # Answered/prewarmed prompts render instantly; fresh ones
+                # stream token-by-token so the first words appear while
+                # Gemini is still generating. Answered prompts get their
+                # own memo key: the prewarm key stays absent until the
+                # sidebar toggle fills it, so its run-once guard holds.
+                memo = st.session_state.setdefault("answered", {})
+                cached = memo.get(prompt)
+                if cached is None:
+                    cached = st.session_state.get("prewarm", {}).get(prompt)
+                if cached is not None:
+                    response, sources = cached
                     st.markdown(response)
-                    
-                    # Add sources expander
-                    with st.expander(f"📚 View {len(sources)} dictionary sources"):
-                        for i, doc in enumerate(sources, 1):
-                            st.text(f"Source {i}:\n{doc.page_content[:300]}...")
-                            if i < len(sources):
-                                st.markdown("---")
-                    
-                    # Add assistant response to chat history
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": response,
-                        "sources": sources
-                    })
-                
-                except Exception as e:
-                    error_msg = f"❌ Error: {str(e)}"
-                    st.error(error_msg)
-                    st.session_state.messages.append({
-                        "role": "assistant",
-                        "content": error_msg,
-                        "sources": []
-                    })
+                else:
+                    sources = []
+                    response = st.write_stream(_stream_translation(prompt, sources))
+                    memo[prompt] = (response, list(sources))
+
+                # Add sources expander
+                with st.expander(f"📚 View {len(sources)} dictionary sources"):
+                    for i, entry in enumerate(sources, 1):
+                        suffix = "..." if len(entry) > 300 else ""
+                        st.text(f"Source {i}:\n{entry[:300]}{suffix}")
+                        if i < len(sources):
+                            st.markdown("---")
+
+                # Add assistant response to chat history - only the
+                # truncated previews are kept, so reruns re-render
+                # less and session state stays small
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": response,
+                    "sources": [(entry[:300], len(entry)) for entry in sources]
+                })
+
+            except Exception as e:
+                error_msg = f"❌ Error: {str(e)}"
+                st.error(error_msg)
+                st.session_state.messages.append({
+                    "role": "assistant",
+                    "content": error_msg,
+                    "sources": []
+                })
     
     # Footer
     st.markdown("---")
@@ -0,0 +1,59 @@
+# rebuild_faiss_index.py - one-time conversion of the Flat FAISS index
+# to IVF + 8-bit scalar quantization for sub-linear search and a 4x
+# smaller vector RAM footprint. Run with: python rebuild_faiss_index.py
+#
+# LangChain's default index is IndexFlat, which scans every vector per
+# query. IVF-SQ8 stores one byte per dimension instead of a float and
+# only visits nprobe inverted lists per query (tuned in app.py). For a
+# dictionary-sized corpus its recall is near-identical to Flat, and it
+# is simpler to train and faster to add to than product quantization.
+
+import faiss
+import numpy as np
+from langchain_community.embeddings import HuggingFaceEmbeddings
+from langchain_community.vectorstores import FAISS
+
+INDEX_DIR = "faiss_index"
+DIM = 384  # all-MiniLM-L6-v2 output
+
+
+def main():
+    embeddings = HuggingFaceEmbeddings(
+        model_name="sentence-transformers/all-MiniLM-L6-v2",
+        model_kwargs={'device': 'cpu'},
+        encode_kwargs={'normalize_embeddings': True}
+    )
+    vectorstore = FAISS.load_local(
+        INDEX_DIR,
+        embeddings,
+        allow_dangerous_deserialization=True
+    )
+
+    ntotal = vectorstore.index.ntotal
+    xb = vectorstore.index.reconstruct_n(0, ntotal)
+
+    # nlist ~ sqrt(N), floored so tiny dictionaries still train cleanly
+    nlist = max(64, int(np.sqrt(ntotal)))
+    print(f"Training IVF{nlist},SQ8 on {ntotal:,} vectors...")
+
+    # L2, not inner product: FAISS.load_local assumes euclidean distances
+    # when converting scores for the similarity_score_threshold retriever,
+    # and with normalized embeddings L2 ranks identically to inner product
+    quantizer = faiss.IndexFlatL2(DIM)
+    index = faiss.IndexIVFScalarQuantizer(
+        quantizer, DIM, nlist,
+        faiss.ScalarQuantizer.QT_8bit,
+        faiss.METRIC_L2
+    )
+    index.train(xb)
+    index.add(xb)
+
+    # Vectors were re-added in reconstruction order, so the docstore id
+    # mapping carried by the vectorstore stays valid
+    vectorstore.index = index
+    vectorstore.save_local(INDEX_DIR)
+    print(f"Saved IVF{nlist},SQ8 index to {INDEX_DIR}/ (was Flat)")
+
+
+if __name__ == "__main__":
+    main()
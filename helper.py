@@ -4,11 +4,16 @@ import os
 from dotenv import load_dotenv, find_dotenv
 
 
-# these expect to find a .env file at the directory above the lesson.    
-# the format for that file is (without the comment)                      
-# API_KEYNAME=AStringThatIsTheLongAPIKeyFromSomeService                                                            
+# these expect to find a .env file at the directory above the lesson.
+# the format for that file is (without the comment)
+# API_KEYNAME=AStringThatIsTheLongAPIKeyFromSomeService
+# find_dotenv() walks up the directory tree with a stat per level, so the
+# scan and parse happen once at import instead of on every getter call.
+_ENV_LOADED = load_dotenv(find_dotenv())
+
+
 def load_env():
-    _ = load_dotenv(find_dotenv())
+    return _ENV_LOADED
 
 
 def get_groq_api_key():